@@ -21,11 +21,11 @@
 import axiosInstance from '../utils/axios'
 
 /**
- * Fetch paginated list of products.
+ * Fetch a page of products.
  * 
- * @param {number} page - Page number (1-indexed)
+ * @param {string|null} cursor - Opaque cursor from a previous page (null for the first page)
  * @param {string} searchTerm - Optional search term for filtering
- * @returns {Promise<Object>} Paginated product list
+ * @returns {Promise<Object>} Page of products with `next`/`previous` links
  * 
  * Educational Note: This calls ProductService's product list endpoint.
  * The JWT token is automatically included by the axios interceptor.
@@ -34,9 +34,16 @@ import axiosInstance from '../utils/axios'
  * 
  * This demonstrates how services can verify JWTs independently without
  * calling UserService for every request - much more scalable!
+ * 
+ * The list uses cursor pagination: instead of page numbers, each response
+ * links to the next/previous page, so deep pages cost the same as the first.
  */
-export async function fetchProducts(page = 1, searchTerm = '') {
-  const params = { page }
+export async function fetchProducts(cursor = null, searchTerm = '') {
+  const params = {}
+  
+  if (cursor) {
+    params.cursor = cursor
+  }
   
   if (searchTerm) {
     params.search = searchTerm
@@ -46,6 +53,19 @@ export async function fetchProducts(page = 1, searchTerm = '') {
   return response.data
 }
 
+/**
+ * Extract the cursor from a `next`/`previous` pagination link.
+ * 
+ * @param {string|null} link - Absolute URL returned by ProductService
+ * @returns {string|null} Cursor value, or null when there is no such page
+ */
+export function getCursor(link) {
+  if (!link) {
+    return null
+  }
+  return new URL(link).searchParams.get('cursor')
+}
+
 /**
  * Fetch a single product by ID.
  * 
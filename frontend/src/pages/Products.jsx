@@ -11,7 +11,7 @@
  */
 
 import { useState, useEffect } from 'react'
-import { fetchProducts } from '../api/productService'
+import { fetchProducts, getCursor } from '../api/productService'
 import Container from '../components/layout/Container'
 import ProductGrid from '../components/product/ProductGrid'
 import ProductSearch from '../components/product/ProductSearch'
@@ -26,15 +26,16 @@ function Products() {
   const [error, setError] = useState('')
   const [searchTerm, setSearchTerm] = useState('')
   const [cart, setCart] = useState([])
-  const [page, setPage] = useState(1)
-  const [totalPages, setTotalPages] = useState(1)
+  const [cursor, setCursor] = useState(null)
+  const [nextCursor, setNextCursor] = useState(null)
+  const [previousCursor, setPreviousCursor] = useState(null)
   const [showOrderForm, setShowOrderForm] = useState(false)
   const [createdOrder, setCreatedOrder] = useState(null)
   
   // Fetch products from ProductService
   useEffect(() => {
     loadProducts()
-  }, [page])
+  }, [cursor])
   
   const loadProducts = async () => {
     try {
@@ -43,14 +44,13 @@ function Products() {
       
       // Educational Note: This calls ProductService API via our API layer
       // The JWT token is automatically added by axios interceptor
-      const data = await fetchProducts(page, searchTerm)
+      const data = await fetchProducts(cursor, searchTerm)
       
       setProducts(data.results || data)
       
-      // Handle pagination if available
-      if (data.count) {
-        setTotalPages(Math.ceil(data.count / 20))
-      }
+      // Cursor pagination: follow the next/previous links
+      setNextCursor(getCursor(data.next))
+      setPreviousCursor(getCursor(data.previous))
       
       setLoading(false)
     } catch (err) {
@@ -63,7 +63,7 @@ function Products() {
   // Handle search
   const handleSearch = (term) => {
     setSearchTerm(term)
-    setPage(1)
+    setCursor(null)
     loadProducts()
   }
   
@@ -208,22 +208,19 @@ function Products() {
       />
       
       {/* Pagination */}
-      {totalPages > 1 && (
+      {(nextCursor || previousCursor) && (
         <div className="mt-8 flex justify-center gap-2">
           <Button
             variant="secondary"
-            onClick={() => setPage(p => Math.max(1, p - 1))}
-            disabled={page === 1}
+            onClick={() => setCursor(previousCursor)}
+            disabled={!previousCursor}
           >
             Previous
           </Button>
-          <span className="px-4 py-2 text-gray-700 flex items-center">
-            Page {page} of {totalPages}
-          </span>
           <Button
             variant="secondary"
-            onClick={() => setPage(p => Math.min(totalPages, p + 1))}
-            disabled={page === totalPages}
+            onClick={() => setCursor(nextCursor)}
+            disabled={!nextCursor}
           >
             Next
           </Button>
@@ -6,18 +6,19 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'order_service.settings')
 django.setup()
 
+from django.db.models import Count
 from orders.models import Order
 
 print("=" * 60)
 print("DEBUG: Order Filtering Issue")
 print("=" * 60)
 
-# Get all orders
-all_orders = Order.objects.all()
-print(f"\n📊 Total orders in database: {all_orders.count()}")
+# Count with a single COUNT(*) query
+print(f"\n📊 Total orders in database: {Order.objects.count()}")
 
-# Check first few orders
-for order in all_orders[:5]:
+# Check first few orders (fetched once, reused below; only the columns shown)
+sample_orders = list(Order.objects.only('id', 'user_id', 'total_amount').order_by('-created_at')[:5])
+for order in sample_orders:
     print(f"\nOrder {order.id}:")
     print(f"  user_id (decrypted): {order.user_id}")
     print(f"  user_id type: {type(order.user_id)}")
@@ -31,16 +32,25 @@ print("=" * 60)
 
 test_user_ids = ["1", 1, "01", " 1", "1 "]
 
+# Educational Note: user_id is a plain indexed CharField, so every test value
+# is an index lookup. Django casts each value with str() before querying, so
+# one grouped query answers all of them instead of one COUNT per value.
+counts = dict(
+    Order.objects.filter(user_id__in=[str(test_id) for test_id in test_user_ids])
+    .order_by()
+    .values_list('user_id')
+    .annotate(count=Count('id'))
+)
+
 for test_id in test_user_ids:
-    filtered = Order.objects.filter(user_id=test_id)
-    print(f"\nFilter by {repr(test_id)} (type: {type(test_id).__name__}): {filtered.count()} orders")
+    print(f"\nFilter by {repr(test_id)} (type: {type(test_id).__name__}): {counts.get(str(test_id), 0)} orders")
 
 # Check if encryption is working
 print("\n" + "=" * 60)
 print("Checking encryption:")
 print("=" * 60)
 
-first_order = all_orders.first()
+first_order = sample_orders[0] if sample_orders else None
 if first_order:
     # Access the raw encrypted value
     from django.db import connection
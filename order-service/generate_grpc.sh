@@ -64,32 +64,40 @@ Note:
     It contains clients to call UserService and ProductService.
 """
 
-# Import all generated modules for convenient access
-# This allows: from orders.grpc_generated import user_pb2
-# Instead of: from orders.grpc_generated.user_pb2 import *
-
-try:
-    from . import user_pb2
-    from . import user_pb2_grpc
-    from . import product_pb2
-    from . import product_pb2_grpc
-    
-    __all__ = [
-        'user_pb2',
-        'user_pb2_grpc',
-        'product_pb2',
-        'product_pb2_grpc',
-    ]
-except ImportError as e:
-    # If imports fail, the generated files don't exist yet
-    # Run generate_grpc.sh to create them
-    import warnings
-    warnings.warn(
-        f"gRPC generated files not found: {e}\n"
-        "Run 'bash generate_grpc.sh' to generate client stubs.",
-        ImportWarning
-    )
-    __all__ = []
+# Educational Note: Generated modules are imported lazily (PEP 562).
+# Loading protobuf modules builds descriptor pools and message classes, which
+# slows down every process start - including management commands and
+# migrations that never make a gRPC call. Accessing an attribute such as
+# `grpc_generated.user_pb2` (or `from orders.grpc_generated import user_pb2`)
+# imports the module on first use and caches it in the package namespace.
+
+import importlib
+
+__all__ = [
+    'user_pb2',
+    'user_pb2_grpc',
+    'product_pb2',
+    'product_pb2_grpc',
+]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(f'.{name}', __name__)
+    except ImportError as e:
+        # The generated files don't exist yet
+        raise ImportError(
+            f"gRPC generated module {name} not found: {e}. "
+            "Run 'bash generate_grpc.sh' to generate client stubs."
+        ) from e
+    globals()[name] = module
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 EOF
 fi
 
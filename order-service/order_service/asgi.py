@@ -14,3 +14,10 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'order_service.settings')
 
 application = get_asgi_application()
+
+# Educational Note: Only processes that serve HTTP verify JWTs, so the key
+# loader starts here instead of in every process that loads settings
+# (management commands, the gRPC clients, runserver's autoreloader).
+from orders.public_key import start_public_key_loader  # noqa: E402
+
+start_public_key_loader()
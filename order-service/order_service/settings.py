@@ -10,9 +10,13 @@ and ProductService to create orders. It demonstrates:
 """
 
 from pathlib import Path
+from urllib.parse import unquote, urlparse
 import os
 import logging
 
+from cryptography.hazmat.primitives import serialization
+from django.utils.functional import SimpleLazyObject
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -72,12 +76,33 @@ WSGI_APPLICATION = 'order_service.wsgi.application'
 
 # Database
 # Educational Note: Each microservice has its own database (service isolation)
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# SQLite is used in development. When DATABASE_URL points at PostgreSQL (as in
+# docker-compose.prod.yml), use it instead: Postgres doesn't serialize writers
+# the way SQLite does. Django 4.2 has no built-in connection pool, so
+# CONN_MAX_AGE keeps each worker's connection open across requests instead.
+DATABASE_URL = os.getenv('DATABASE_URL', '')
+
+if DATABASE_URL.startswith(('postgres://', 'postgresql://')):
+    _database_url = urlparse(DATABASE_URL)
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': _database_url.path.lstrip('/'),
+            'USER': unquote(_database_url.username or ''),
+            'PASSWORD': unquote(_database_url.password or ''),
+            'HOST': _database_url.hostname or '',
+            'PORT': str(_database_url.port or ''),
+            'CONN_MAX_AGE': 60,  # Reuse connections for up to 60 seconds
+            'CONN_HEALTH_CHECKS': True,  # Drop dead connections before reuse
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+        }
     }
-}
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -120,9 +145,6 @@ CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
         'LOCATION': os.getenv('REDIS_URL', 'redis://redis:6379/1'),
-        'OPTIONS': {
-            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
-        },
         'KEY_PREFIX': 'order_service',
         'TIMEOUT': 300,  # Default timeout: 5 minutes
     }
@@ -155,74 +177,66 @@ REST_FRAMEWORK = {
 # 3. Scalability: Multiple services can verify tokens independently
 # 4. Standard: Used by Auth0, Okta, AWS Cognito, Google Identity Platform
 
+USER_SERVICE_URL = os.getenv('USER_SERVICE_URL', 'http://user-service:8000')
+JWT_PUBLIC_KEY_PATH = os.getenv('JWT_PUBLIC_KEY_PATH', '/app/keys/jwt_public.pem')
+
+# Redis entry through which workers share a key fetched from UserService
+JWT_PUBLIC_KEY_CACHE_KEY = 'jwt_pubkey'
+JWT_PUBLIC_KEY_CACHE_TIMEOUT = 3600  # 1 hour
+
+
 def load_jwt_public_key():
     """
-    Load JWT public key with fallback strategies.
+    Read the JWT public key from the shared volume.
     
-    Strategy:
-    1. Try to read from shared volume (fastest)
-    2. Fetch from UserService HTTP endpoint with retry (fallback)
-    3. Return None if all attempts fail (degraded mode)
+    Only the local file is read here, so nothing that forces the key waits
+    on the network. Fetching from UserService (through the shared Redis
+    cache first) happens in a background thread started by wsgi.py/asgi.py;
+    see orders/public_key.py. Returns None if there is no key yet
+    (degraded mode until the background load succeeds).
     """
-    import time
-    import requests
-    
-    public_key_path = os.getenv('JWT_PUBLIC_KEY_PATH', '/app/keys/jwt_public.pem')
-    user_service_url = os.getenv('USER_SERVICE_URL', 'http://user-service:8000')
-    
-    # Strategy 1: Try to read from shared volume
-    if os.path.exists(public_key_path):
+    if os.path.exists(JWT_PUBLIC_KEY_PATH):
         try:
-            with open(public_key_path, 'r') as f:
+            with open(JWT_PUBLIC_KEY_PATH, 'r') as f:
                 public_key = f.read()
-            logging.info(f"✅ JWT public key loaded from shared volume: {public_key_path}")
+            logging.info(f"✅ JWT public key loaded from shared volume: {JWT_PUBLIC_KEY_PATH}")
             return public_key
         except Exception as e:
             logging.warning(f"⚠️  Failed to read public key from volume: {e}")
     
-    # Strategy 2: Fetch from UserService HTTP endpoint with retry
-    max_retries = 5
-    retry_delay = 2  # seconds
-    
-    for attempt in range(1, max_retries + 1):
-        try:
-            logging.info(f"🔄 Fetching public key from UserService (attempt {attempt}/{max_retries})...")
-            response = requests.get(
-                f'{user_service_url}/api/users/public-key/',
-                timeout=5
-            )
-            response.raise_for_status()
-            
-            public_key = response.json()['public_key']
-            
-            # Save to local file for future use
-            try:
-                os.makedirs(os.path.dirname(public_key_path), exist_ok=True)
-                with open(public_key_path, 'w') as f:
-                    f.write(public_key)
-                logging.info(f"✅ JWT public key fetched and saved to {public_key_path}")
-            except Exception as e:
-                logging.warning(f"⚠️  Could not save public key to file: {e}")
-            
-            return public_key
-            
-        except requests.exceptions.RequestException as e:
-            logging.error(f"❌ Attempt {attempt} failed: {e}")
-            if attempt < max_retries:
-                logging.info(f"   Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
-            else:
-                logging.error(f"❌ Failed to fetch public key after {max_retries} attempts")
-    
-    # Strategy 3: Return None and log warning
-    logging.warning("⚠️  WARNING: Could not load JWT public key!")
+    logging.warning("⚠️  WARNING: No JWT public key on disk yet!")
+    logging.warning("   It will be fetched from UserService in the background.")
     logging.warning("   Authentication will not work until key is available.")
-    logging.warning("   Service will start in degraded mode.")
     return None
 
-# Load public key on startup
-JWT_PUBLIC_KEY = load_jwt_public_key()
+
+def parse_jwt_public_key(public_key):
+    """
+    Parse a PEM public key into a key object (None if missing or invalid).
+    
+    Educational Note: PyJWT accepts either PEM or a key object. Given PEM it
+    parses the key again for every token it verifies; given the object it
+    uses it as-is, so the key is parsed once, here.
+    """
+    if not public_key:
+        return None
+    try:
+        return serialization.load_pem_public_key(public_key.encode('utf-8'))
+    except ValueError as e:
+        logging.error(f"❌ Invalid JWT public key: {e}")
+        return None
+
+
+def load_jwt_verifying_key():
+    """Load the public key from disk and parse it into a key object."""
+    return parse_jwt_public_key(load_jwt_public_key())
+
+# Load public key lazily on first token verification
+# Educational Note: Loading at import time blocked startup for up to ~60s of
+# retries while UserService was still booting. SimpleLazyObject defers the
+# load until the key is first used and then behaves like the key object.
+# If the file isn't there yet, the background loader fills the key in later.
+JWT_PUBLIC_KEY = SimpleLazyObject(load_jwt_verifying_key)
 
 from datetime import timedelta
 
@@ -276,6 +290,15 @@ RETRY_MAX_WAIT = 10  # Maximum wait time between retries (seconds)
 CIRCUIT_BREAKER_FAIL_MAX = 5  # Open circuit after 5 failures
 CIRCUIT_BREAKER_TIMEOUT = 30  # Try again after 30 seconds
 
+# Size of the per-process pool that runs gRPC calls concurrently
+# Educational Note: Each order create() holds 2 slots (the user check and
+# the inventory reservation). With fewer than 2 slots per WSGI thread, calls
+# queue behind other requests' calls and a request can wait longer than its
+# own RPCs take, so set this to at least 2x the server's threads per process
+# (e.g. gunicorn --threads 8 -> 16). runserver starts a thread per request,
+# so under it the pool is the only limit on concurrent fan-out.
+RPC_FANOUT_WORKERS = int(os.getenv('RPC_FANOUT_WORKERS', '16'))
+
 # Logging configuration
 LOGGING = {
     'version': 1,
@@ -8,10 +8,14 @@ class OrderAdmin(admin.ModelAdmin):
     list_filter = ('status', 'created_at')
     search_fields = ('user_id',)
     readonly_fields = ('created_at', 'updated_at')
+    ordering = ('-created_at',)
 
 
 @admin.register(OrderItem)
 class OrderItemAdmin(admin.ModelAdmin):
     list_display = ('id', 'order', 'product_id', 'quantity', 'price_at_purchase')
+    # Educational Note: Rendering the 'order' column reads item.order for every
+    # row. Joining orders in the list query avoids one extra query per item.
+    list_select_related = ('order',)
     list_filter = ('order',)
     search_fields = ('product_id',)
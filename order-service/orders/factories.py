@@ -14,6 +14,16 @@ from decimal import Decimal
 import random
 from .models import Order, OrderItem
 
+# Cross-service ids as strings, built once (user_id/product_id are CharFields)
+USER_IDS = tuple(str(n) for n in range(1, 11))
+PRODUCT_IDS = tuple(str(n) for n in range(1, 21))
+QUANTITIES = tuple(range(1, 6))
+
+
+def _random_quantity(choice=random.choice, quantities=QUANTITIES):
+    """Pick a quantity (1-5); defaults bind the lookups once."""
+    return choice(quantities)
+
 
 class OrderFactory(DjangoModelFactory):
     """
@@ -31,7 +41,7 @@ class OrderFactory(DjangoModelFactory):
     
     # Educational Note: user_id is a string that references UserService
     # It will be encrypted automatically by django-encrypted-model-fields
-    user_id = factory.Sequence(lambda n: str(n % 10 + 1))  # Users 1-10
+    user_id = factory.Iterator(USER_IDS)  # Users 1-10, in turn
     
     # Default to pending status
     status = 'pending'
@@ -59,17 +69,19 @@ class OrderItemFactory(DjangoModelFactory):
     order = factory.SubFactory(OrderFactory)
     
     # Educational Note: product_id is a string that references ProductService
-    # We use products 1-20 (assuming they exist from seeding)
-    product_id = factory.LazyFunction(lambda: str(random.randint(1, 20)))
+    # We use products 1-20 in turn (assuming they exist from seeding)
+    product_id = factory.Iterator(PRODUCT_IDS)
     
     # Random quantity between 1 and 5
-    quantity = factory.LazyFunction(lambda: random.randint(1, 5))
+    quantity = factory.LazyFunction(_random_quantity)
     
     # Random price between $10 and $500
     # Educational Note: This is the price at time of purchase
     # In a real system, you'd fetch this from ProductService
+    # Picking a whole number of cents and shifting the exponent builds the
+    # Decimal directly, without going through float rounding and str().
     price_at_purchase = factory.LazyFunction(
-        lambda: Decimal(str(round(random.uniform(10.00, 500.00), 2)))
+        lambda: Decimal(random.randrange(1000, 50001)).scaleb(-2)
     )
 
 
@@ -79,8 +91,15 @@ class CompleteOrderFactory(OrderFactory):
     
     Educational Note: This demonstrates the post_generation hook
     which allows creating related objects after the main object is created.
+    
+    Pass status to create orders in other lifecycle states, e.g.
+    CompleteOrderFactory.create_batch(5, status='shipped').
     """
     
+    class Meta:
+        # The items hook saves the order itself; skip factory_boy's extra save
+        skip_postgeneration_save = True
+    
     @factory.post_generation
     def items(self, create, extracted, **kwargs):
         """
@@ -93,6 +112,9 @@ class CompleteOrderFactory(OrderFactory):
             
         Educational Note: post_generation hooks run after object creation.
         This is perfect for creating related objects and updating calculated fields.
+        Items are built in memory and inserted with one bulk_create, and the
+        total is summed from those instances, so each order costs a fixed
+        number of queries however many items it has.
         """
         if not create:
             # Build strategy, not create
@@ -100,35 +122,16 @@ class CompleteOrderFactory(OrderFactory):
         
         if extracted:
             # Use explicitly provided items
-            for item_data in extracted:
-                OrderItem.objects.create(order=self, **item_data)
+            items = [OrderItem(order=self, **item_data) for item_data in extracted]
         else:
-            # Create random number of items (1-5)
-            num_items = random.randint(1, 5)
-            for _ in range(num_items):
-                OrderItemFactory.create(order=self)
+            # Build random number of items (1-5)
+            items = OrderItemFactory.build_batch(random.randint(1, 5), order=self)
+        OrderItem.objects.bulk_create(items)
         
-        # Recalculate total amount
-        total = sum(item.subtotal for item in self.items.all())
-        self.total_amount = total
-        self.save()
-
-
-class PendingOrderFactory(CompleteOrderFactory):
-    """Factory for creating orders in pending status."""
-    status = 'pending'
-
-
-class ConfirmedOrderFactory(CompleteOrderFactory):
-    """Factory for creating orders in confirmed status."""
-    status = 'confirmed'
-
-
-class ShippedOrderFactory(CompleteOrderFactory):
-    """Factory for creating orders in shipped status."""
-    status = 'shipped'
-
-
-class DeliveredOrderFactory(CompleteOrderFactory):
-    """Factory for creating orders in delivered status."""
-    status = 'delivered'
+        # Keep the created items on the order so callers (e.g. tests) can
+        # inspect them without another query
+        self._created_items = items
+        
+        # Recalculate total amount (no need to re-read the items)
+        self.total_amount = sum(item.subtotal for item in items)
+        self.save(update_fields=['total_amount', 'updated_at'])
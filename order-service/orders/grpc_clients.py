@@ -15,7 +15,9 @@ Why these patterns matter:
 
 import grpc
 import logging
-import sys
+import threading
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -26,31 +28,48 @@ from tenacity import (
 from pybreaker import CircuitBreaker, CircuitBreakerError
 from django.conf import settings
 
-# Import generated gRPC code
-# Educational Note: We use absolute imports to avoid relative import issues
-try:
-    from orders.grpc_generated import user_pb2, user_pb2_grpc
-    from orders.grpc_generated import product_pb2, product_pb2_grpc
-    
-    # Verify imports succeeded
-    if user_pb2 is None or user_pb2_grpc is None:
-        raise ImportError("gRPC modules imported but are None")
-    if product_pb2 is None or product_pb2_grpc is None:
-        raise ImportError("gRPC modules imported but are None")
-        
-except ImportError as e:
-    print(f"CRITICAL ERROR: Failed to import gRPC modules: {e}", file=sys.stderr)
-    print("This will cause order creation to fail!", file=sys.stderr)
-    print("Solution: Run 'docker compose exec order-service python manage.py shell' and check imports", file=sys.stderr)
-    # Re-raise to make the error visible
-    raise ImportError(
-        f"Failed to import gRPC modules. "
-        f"Make sure generate_grpc.sh has been run and generated files exist. "
-        f"Original error: {e}"
-    )
+# Generated gRPC code
+# Educational Note: The grpc_generated package loads its protobuf modules
+# lazily, on first attribute access. Referencing them through the package
+# (grpc_generated.user_pb2) instead of importing them here keeps them out of
+# processes that never make a gRPC call, such as migrations and seed_data.
+from orders import grpc_generated
 
+# Educational Note: Log calls on the RPC path pass their values as arguments
+# (logger.info("... %s", x)) instead of f-strings, so a message is only
+# formatted when its level is actually enabled.
 logger = logging.getLogger(__name__)
 
+# Sent as requesting_service on every request
+REQUESTING_SERVICE = 'order-service'
+
+# Settings used by the clients, read once at import
+# Educational Note: Every settings.X access goes through Django's
+# LazySettings; these values don't change while the process runs.
+_USER_SERVICE_URL = settings.USER_SERVICE_GRPC_URL
+_PRODUCT_SERVICE_URL = settings.PRODUCT_SERVICE_GRPC_URL
+_AUTH_METADATA = (
+    ('authorization', f'Bearer {settings.SERVICE_SECRET}'),
+)
+_RETRY_ATTEMPTS = settings.RETRY_ATTEMPTS
+_RETRY_MIN_WAIT = settings.RETRY_MIN_WAIT
+_RETRY_MAX_WAIT = settings.RETRY_MAX_WAIT
+_BREAKER_FAIL_MAX = settings.CIRCUIT_BREAKER_FAIL_MAX
+_BREAKER_RESET_TIMEOUT = settings.CIRCUIT_BREAKER_TIMEOUT
+
+# Educational Note: Channel options
+# Without keepalive pings, an idle connection can be silently dropped by a
+# NAT or load balancer; the next call then fails and goes through the
+# retry/circuit-breaker path. Pinging every 30s keeps the connection alive
+# and detects dead peers early.
+GRPC_CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.use_local_subchannel_pool', 1),
+]
+
 
 # Educational Note: Circuit Breaker Pattern
 # A circuit breaker prevents calling a failing service repeatedly.
@@ -66,23 +85,100 @@ logger = logging.getLogger(__name__)
 # - Used by: Netflix (Hystrix), AWS, Google Cloud
 
 user_service_breaker = CircuitBreaker(
-    fail_max=settings.CIRCUIT_BREAKER_FAIL_MAX,
-    reset_timeout=settings.CIRCUIT_BREAKER_TIMEOUT,
+    fail_max=_BREAKER_FAIL_MAX,
+    reset_timeout=_BREAKER_RESET_TIMEOUT,
     name='UserService'
 )
 
 product_service_breaker = CircuitBreaker(
-    fail_max=settings.CIRCUIT_BREAKER_FAIL_MAX,
-    reset_timeout=settings.CIRCUIT_BREAKER_TIMEOUT,
+    fail_max=_BREAKER_FAIL_MAX,
+    reset_timeout=_BREAKER_RESET_TIMEOUT,
     name='ProductService'
 )
 
 
+# Educational Note: Retry Configuration
+# stop_after_attempt: Maximum number of retry attempts
+# wait_exponential: Wait time doubles after each failure (1s, 2s, 4s, 8s...)
+# retry_if_exception_type: Only retry on gRPC errors (not business logic errors)
+# before_sleep_log: Log before each retry attempt
+#
+# Why exponential backoff?
+# - Gives service time to recover
+# - Prevents overwhelming a struggling service
+# - Standard pattern used by AWS, Google Cloud, Azure
+_log_before_retry = before_sleep_log(logger, logging.WARNING)
+
+
+def _maybe_retry(func):
+    """
+    Wrap func with tenacity retry, unless retries are disabled.
+    
+    Educational Note: With RETRY_ATTEMPTS <= 1 a retry wrapper can never
+    retry, but tenacity would still set up its retry state on every call.
+    In that case the function is returned undecorated.
+    """
+    if _RETRY_ATTEMPTS <= 1:
+        return func
+    return retry(
+        stop=stop_after_attempt(_RETRY_ATTEMPTS),
+        wait=wait_exponential(
+            min=_RETRY_MIN_WAIT,
+            max=_RETRY_MAX_WAIT
+        ),
+        retry=retry_if_exception_type(grpc.RpcError),
+        before_sleep=_log_before_retry,
+    )(func)
+
+
 class GRPCClientError(Exception):
     """Base exception for gRPC client errors."""
     pass
 
 
+def _price_cents(message) -> int:
+    """
+    Price of a ProductInfo/ReservationResult as an integer number of cents.
+    
+    Educational Note: price_cents lets callers add up prices with integer
+    arithmetic. A ProductService from before price_cents leaves it at 0
+    (the proto3 default, never a real price), so fall back to the string.
+    """
+    if message.price_cents:
+        return message.price_cents
+    return int(Decimal(message.price).scaleb(2)) if message.price else 0
+
+
+def _product_info_result(response) -> dict:
+    """Convert a ProductInfoResponse to the dict returned by the client."""
+    result = {
+        'exists': response.exists,
+        'error_message': response.error_message,
+    }
+    
+    if response.exists:
+        result['product_info'] = {
+            'id': response.product_info.id,
+            'name': response.product_info.name,
+            'description': response.product_info.description,
+            'price': response.product_info.price,
+            'price_cents': _price_cents(response.product_info),
+            'inventory_count': response.product_info.inventory_count,
+            'is_available': response.product_info.is_available,
+        }
+    
+    return result
+
+
+def _availability_result(response) -> dict:
+    """Convert an AvailabilityResponse to the dict returned by the client."""
+    return {
+        'available': response.available,
+        'available_quantity': response.available_quantity,
+        'error_message': response.error_message,
+    }
+
+
 class UserServiceClient:
     """
     Client for UserService gRPC API with resilience patterns.
@@ -95,18 +191,33 @@ class UserServiceClient:
     """
     
     def __init__(self):
-        self.url = settings.USER_SERVICE_GRPC_URL
+        self.url = _USER_SERVICE_URL
         self.channel = None
-        self.stub = None
+        self._channel_lock = threading.Lock()
+        self._local = threading.local()
+        self._metadata = _AUTH_METADATA
+    
+    def _get_channel(self):
+        """Get or create the shared gRPC channel."""
+        # Educational Note: gRPC channels are expensive to create and
+        # thread-safe, so one channel is shared by every thread
+        if self.channel is None:
+            with self._channel_lock:
+                if self.channel is None:
+                    self.channel = grpc.insecure_channel(
+                        self.url, options=GRPC_CHANNEL_OPTIONS
+                    )
+        return self.channel
     
     def _get_stub(self):
-        """Get or create gRPC stub."""
-        if self.stub is None:
-            # Educational Note: gRPC channels are expensive to create
-            # We reuse the same channel for multiple requests
-            self.channel = grpc.insecure_channel(self.url)
-            self.stub = user_pb2_grpc.UserServiceStub(self.channel)
-        return self.stub
+        """Get or create gRPC stub for the current thread."""
+        # Educational Note: Stubs are cheap wrappers around the channel;
+        # giving each thread its own avoids sharing per-stub state
+        stub = getattr(self._local, 'stub', None)
+        if stub is None:
+            stub = grpc_generated.user_pb2_grpc.UserServiceStub(self._get_channel())
+            self._local.stub = stub
+        return stub
     
     def _get_metadata(self):
         """
@@ -117,31 +228,10 @@ class UserServiceClient:
         
         In production, use mutual TLS or service mesh (Istio) instead.
         """
-        service_secret = settings.SERVICE_SECRET
-        return [
-            ('authorization', f'Bearer {service_secret}'),
-        ]
+        return self._metadata
     
-    @retry(
-        # Educational Note: Retry Configuration
-        # stop_after_attempt: Maximum number of retry attempts
-        # wait_exponential: Wait time doubles after each failure (1s, 2s, 4s, 8s...)
-        # retry_if_exception_type: Only retry on gRPC errors (not business logic errors)
-        # before_sleep_log: Log before each retry attempt
-        #
-        # Why exponential backoff?
-        # - Gives service time to recover
-        # - Prevents overwhelming a struggling service
-        # - Standard pattern used by AWS, Google Cloud, Azure
-        stop=stop_after_attempt(settings.RETRY_ATTEMPTS),
-        wait=wait_exponential(
-            min=settings.RETRY_MIN_WAIT,
-            max=settings.RETRY_MAX_WAIT
-        ),
-        retry=retry_if_exception_type(grpc.RpcError),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-    )
     @user_service_breaker
+    @_maybe_retry
     def validate_user(self, user_id: int) -> dict:
         """
         Validate if a user exists and is active.
@@ -157,25 +247,29 @@ class UserServiceClient:
             CircuitBreakerError: If circuit breaker is open
             
         Educational Note: This method is decorated with:
-        1. @retry: Automatically retries on transient failures
-        2. @user_service_breaker: Circuit breaker prevents repeated calls to failing service
+        1. @user_service_breaker: Circuit breaker prevents repeated calls to failing service
+        2. @_maybe_retry: Automatically retries on transient failures
         
         The decorators work together:
         - First, retry handles transient failures (network blips)
         - If retries fail repeatedly, circuit breaker opens
         - When circuit is open, calls fail immediately (no retry)
+        
+        The breaker is the outer decorator, so an open circuit fails fast
+        before any retry state is set up, and a call that exhausts its
+        retries counts as one failure.
         """
         try:
             stub = self._get_stub()
             
             # Create request
-            request = user_pb2.ValidateUserRequest(
+            request = grpc_generated.user_pb2.ValidateUserRequest(
                 user_id=user_id,
-                requesting_service='order-service'
+                requesting_service=REQUESTING_SERVICE
             )
             
             # Make gRPC call with authentication metadata
-            logger.info(f"🔍 Validating user {user_id} via gRPC")
+            logger.info("🔍 Validating user %s via gRPC", user_id)
             response = stub.ValidateUser(request, metadata=self._get_metadata())
             
             # Convert protobuf response to dict
@@ -191,23 +285,27 @@ class UserServiceClient:
                     'email': response.user_info.email,
                     'is_active': response.user_info.is_active,
                 }
-                logger.info(f"✅ User {user_id} validated successfully")
+                logger.info("✅ User %s validated successfully", user_id)
             else:
-                logger.warning(f"❌ User {user_id} validation failed: {response.error_message}")
+                logger.warning("❌ User %s validation failed: %s", user_id, response.error_message)
             
             return result
             
         except grpc.RpcError as e:
-            logger.error(f"❌ gRPC error validating user {user_id}: {e.code()} - {e.details()}")
+            logger.error("❌ gRPC error validating user %s: %s - %s", user_id, e.code(), e.details())
             raise GRPCClientError(f"Failed to validate user: {e.details()}")
         except CircuitBreakerError:
-            logger.error(f"⚡ Circuit breaker OPEN for UserService - failing fast")
+            logger.error("⚡ Circuit breaker OPEN for UserService - failing fast")
             raise
     
     def close(self):
         """Close gRPC channel."""
-        if self.channel:
-            self.channel.close()
+        with self._channel_lock:
+            if self.channel:
+                self.channel.close()
+                self.channel = None
+            # Drop stubs bound to the closed channel
+            self._local = threading.local()
 
 
 class ProductServiceClient:
@@ -216,16 +314,29 @@ class ProductServiceClient:
     """
     
     def __init__(self):
-        self.url = settings.PRODUCT_SERVICE_GRPC_URL
+        self.url = _PRODUCT_SERVICE_URL
         self.channel = None
-        self.stub = None
+        self._channel_lock = threading.Lock()
+        self._local = threading.local()
+        self._metadata = _AUTH_METADATA
+    
+    def _get_channel(self):
+        """Get or create the shared gRPC channel."""
+        if self.channel is None:
+            with self._channel_lock:
+                if self.channel is None:
+                    self.channel = grpc.insecure_channel(
+                        self.url, options=GRPC_CHANNEL_OPTIONS
+                    )
+        return self.channel
     
     def _get_stub(self):
-        """Get or create gRPC stub."""
-        if self.stub is None:
-            self.channel = grpc.insecure_channel(self.url)
-            self.stub = product_pb2_grpc.ProductServiceStub(self.channel)
-        return self.stub
+        """Get or create gRPC stub for the current thread."""
+        stub = getattr(self._local, 'stub', None)
+        if stub is None:
+            stub = grpc_generated.product_pb2_grpc.ProductServiceStub(self._get_channel())
+            self._local.stub = stub
+        return stub
     
     def _get_metadata(self):
         """
@@ -234,21 +345,10 @@ class ProductServiceClient:
         Educational Note: gRPC metadata is similar to HTTP headers.
         We use it to pass the SERVICE_SECRET for service-to-service authentication.
         """
-        service_secret = settings.SERVICE_SECRET
-        return [
-            ('authorization', f'Bearer {service_secret}'),
-        ]
+        return self._metadata
     
-    @retry(
-        stop=stop_after_attempt(settings.RETRY_ATTEMPTS),
-        wait=wait_exponential(
-            min=settings.RETRY_MIN_WAIT,
-            max=settings.RETRY_MAX_WAIT
-        ),
-        retry=retry_if_exception_type(grpc.RpcError),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-    )
     @product_service_breaker
+    @_maybe_retry
     def get_product_info(self, product_id: int) -> dict:
         """
         Get product information including price and availability.
@@ -266,51 +366,32 @@ class ProductServiceClient:
         try:
             stub = self._get_stub()
             
-            request = product_pb2.ProductInfoRequest(
+            request = grpc_generated.product_pb2.ProductInfoRequest(
                 product_id=product_id,
-                requesting_service='order-service'
+                requesting_service=REQUESTING_SERVICE
             )
             
-            logger.info(f"🔍 Getting product info for {product_id} via gRPC")
+            logger.info("🔍 Getting product info for %s via gRPC", product_id)
             response = stub.GetProductInfo(request, metadata=self._get_metadata())
             
-            result = {
-                'exists': response.exists,
-                'error_message': response.error_message,
-            }
+            result = _product_info_result(response)
             
             if response.exists:
-                result['product_info'] = {
-                    'id': response.product_info.id,
-                    'name': response.product_info.name,
-                    'description': response.product_info.description,
-                    'price': response.product_info.price,
-                    'inventory_count': response.product_info.inventory_count,
-                    'is_available': response.product_info.is_available,
-                }
-                logger.info(f"✅ Product {product_id} info retrieved successfully")
+                logger.info("✅ Product %s info retrieved successfully", product_id)
             else:
-                logger.warning(f"❌ Product {product_id} not found: {response.error_message}")
+                logger.warning("❌ Product %s not found: %s", product_id, response.error_message)
             
             return result
             
         except grpc.RpcError as e:
-            logger.error(f"❌ gRPC error getting product {product_id}: {e.code()} - {e.details()}")
+            logger.error("❌ gRPC error getting product %s: %s - %s", product_id, e.code(), e.details())
             raise GRPCClientError(f"Failed to get product info: {e.details()}")
         except CircuitBreakerError:
-            logger.error(f"⚡ Circuit breaker OPEN for ProductService - failing fast")
+            logger.error("⚡ Circuit breaker OPEN for ProductService - failing fast")
             raise
     
-    @retry(
-        stop=stop_after_attempt(settings.RETRY_ATTEMPTS),
-        wait=wait_exponential(
-            min=settings.RETRY_MIN_WAIT,
-            max=settings.RETRY_MAX_WAIT
-        ),
-        retry=retry_if_exception_type(grpc.RpcError),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-    )
     @product_service_breaker
+    @_maybe_retry
     def check_availability(self, product_id: int, quantity: int) -> dict:
         """
         Check if sufficient inventory exists for a quantity.
@@ -329,39 +410,152 @@ class ProductServiceClient:
         try:
             stub = self._get_stub()
             
-            request = product_pb2.AvailabilityRequest(
+            request = grpc_generated.product_pb2.AvailabilityRequest(
                 product_id=product_id,
                 quantity=quantity,
-                requesting_service='order-service'
+                requesting_service=REQUESTING_SERVICE
             )
             
-            logger.info(f"🔍 Checking availability for product {product_id} (qty: {quantity}) via gRPC")
+            logger.info("🔍 Checking availability for product %s (qty: %s) via gRPC", product_id, quantity)
             response = stub.CheckAvailability(request, metadata=self._get_metadata())
             
-            result = {
-                'available': response.available,
-                'available_quantity': response.available_quantity,
-                'error_message': response.error_message,
-            }
+            result = _availability_result(response)
             
             if response.available:
-                logger.info(f"✅ Product {product_id} available (qty: {quantity})")
+                logger.info("✅ Product %s available (qty: %s)", product_id, quantity)
             else:
-                logger.warning(f"❌ Product {product_id} not available: {response.error_message}")
+                logger.warning("❌ Product %s not available: %s", product_id, response.error_message)
             
             return result
             
         except grpc.RpcError as e:
-            logger.error(f"❌ gRPC error checking availability for {product_id}: {e.code()} - {e.details()}")
+            logger.error("❌ gRPC error checking availability for %s: %s - %s", product_id, e.code(), e.details())
             raise GRPCClientError(f"Failed to check availability: {e.details()}")
         except CircuitBreakerError:
-            logger.error(f"⚡ Circuit breaker OPEN for ProductService - failing fast")
+            logger.error("⚡ Circuit breaker OPEN for ProductService - failing fast")
+            raise
+    
+    # Educational Note: The reservation calls change inventory, so they are
+    # not wrapped in @_maybe_retry: retrying a reservation whose response was
+    # lost would reserve the same stock twice.
+    @product_service_breaker
+    def reserve_inventory(self, items: list) -> dict:
+        """
+        Reserve inventory for all items of an order, all-or-nothing.
+        
+        Args:
+            items: (product_id, quantity) pairs to reserve
+            
+        Returns:
+            dict with keys: ok, results (one dict per item, in order, with
+            keys: product_id, exists, reserved, price, price_cents,
+            available_quantity, error_message). Nothing is reserved unless ok is True.
+            
+        Raises:
+            GRPCClientError: If gRPC call fails
+            CircuitBreakerError: If circuit breaker is open
+        """
+        try:
+            stub = self._get_stub()
+            
+            request = grpc_generated.product_pb2.ReserveInventoryRequest(
+                items=[
+                    grpc_generated.product_pb2.ProductQuantity(
+                        product_id=product_id,
+                        quantity=quantity
+                    )
+                    for product_id, quantity in items
+                ],
+                requesting_service=REQUESTING_SERVICE
+            )
+            
+            logger.info("🔒 Reserving inventory for %s items via gRPC", len(items))
+            response = stub.ReserveInventory(request, metadata=self._get_metadata())
+            
+            if response.ok and len(response.results) != len(items):
+                raise GRPCClientError(
+                    f"Expected {len(items)} reservation results, got {len(response.results)}"
+                )
+            
+            result = {
+                'ok': response.ok,
+                'results': [
+                    {
+                        'product_id': r.product_id,
+                        'exists': r.exists,
+                        'reserved': r.reserved,
+                        'price': r.price,
+                        'price_cents': _price_cents(r),
+                        'available_quantity': r.available_quantity,
+                        'error_message': r.error_message,
+                    }
+                    for r in response.results
+                ],
+            }
+            
+            if response.ok:
+                logger.info("✅ Inventory reserved for %s items", len(items))
+            else:
+                logger.warning("❌ Inventory reservation failed for %s items", len(items))
+            
+            return result
+            
+        except grpc.RpcError as e:
+            logger.error("❌ gRPC error reserving inventory for %s items: %s - %s", len(items), e.code(), e.details())
+            raise GRPCClientError(f"Failed to reserve inventory: {e.details()}")
+        except CircuitBreakerError:
+            logger.error("⚡ Circuit breaker OPEN for ProductService - failing fast")
+            raise
+    
+    @product_service_breaker
+    def release_inventory(self, items: list) -> bool:
+        """
+        Return inventory reserved by reserve_inventory().
+        
+        Args:
+            items: (product_id, quantity) pairs that were reserved
+            
+        Returns:
+            True if ProductService returned the inventory
+            
+        Raises:
+            GRPCClientError: If gRPC call fails
+            CircuitBreakerError: If circuit breaker is open
+        """
+        try:
+            stub = self._get_stub()
+            
+            request = grpc_generated.product_pb2.ReleaseInventoryRequest(
+                items=[
+                    grpc_generated.product_pb2.ProductQuantity(
+                        product_id=product_id,
+                        quantity=quantity
+                    )
+                    for product_id, quantity in items
+                ],
+                requesting_service=REQUESTING_SERVICE
+            )
+            
+            logger.info("🔓 Releasing inventory for %s items via gRPC", len(items))
+            response = stub.ReleaseInventory(request, metadata=self._get_metadata())
+            
+            return response.ok
+            
+        except grpc.RpcError as e:
+            logger.error("❌ gRPC error releasing inventory for %s items: %s - %s", len(items), e.code(), e.details())
+            raise GRPCClientError(f"Failed to release inventory: {e.details()}")
+        except CircuitBreakerError:
+            logger.error("⚡ Circuit breaker OPEN for ProductService - failing fast")
             raise
     
     def close(self):
         """Close gRPC channel."""
-        if self.channel:
-            self.channel.close()
+        with self._channel_lock:
+            if self.channel:
+                self.channel.close()
+                self.channel = None
+            # Drop stubs bound to the closed channel
+            self._local = threading.local()
 
 
 # Singleton instances
@@ -369,13 +563,21 @@ class ProductServiceClient:
 # Creating new channels for each request is expensive and inefficient
 _user_service_client = None
 _product_service_client = None
+_rpc_executor = None
+
+# Educational Note: Under a threaded server the first requests can arrive
+# at the same time; without a lock each could create its own client (and
+# channel, i.e. its own TCP/HTTP2 connection) and all but one would leak.
+_singleton_lock = threading.Lock()
 
 
 def get_user_service_client() -> UserServiceClient:
     """Get singleton UserServiceClient instance."""
     global _user_service_client
     if _user_service_client is None:
-        _user_service_client = UserServiceClient()
+        with _singleton_lock:
+            if _user_service_client is None:
+                _user_service_client = UserServiceClient()
     return _user_service_client
 
 
@@ -383,5 +585,27 @@ def get_product_service_client() -> ProductServiceClient:
     """Get singleton ProductServiceClient instance."""
     global _product_service_client
     if _product_service_client is None:
-        _product_service_client = ProductServiceClient()
+        with _singleton_lock:
+            if _product_service_client is None:
+                _product_service_client = ProductServiceClient()
     return _product_service_client
+
+
+def get_rpc_executor() -> ThreadPoolExecutor:
+    """
+    Get singleton thread pool for running independent gRPC calls concurrently.
+    
+    Educational Note: The clients use synchronous channels, which are
+    thread-safe and multiplex concurrent calls as HTTP/2 streams over one
+    connection. Submitting independent calls to this pool lets a request
+    wait for the slowest call instead of the sum of all of them.
+    """
+    global _rpc_executor
+    if _rpc_executor is None:
+        with _singleton_lock:
+            if _rpc_executor is None:
+                _rpc_executor = ThreadPoolExecutor(
+                    max_workers=settings.RPC_FANOUT_WORKERS,
+                    thread_name_prefix='grpc-fanout',
+                )
+    return _rpc_executor
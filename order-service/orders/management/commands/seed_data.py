@@ -11,19 +11,18 @@ Usage: python manage.py seed_data [--orders 30] [--clear]
 """
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from orders.factories import (
-    CompleteOrderFactory,
-    PendingOrderFactory,
-    ConfirmedOrderFactory,
-    ShippedOrderFactory,
-    DeliveredOrderFactory,
-)
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+from orders.factories import OrderFactory, OrderItemFactory
 from orders.models import Order, OrderItem
 import logging
+import random
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT statement in bulk_create
+BULK_BATCH_SIZE = 1000
+
 
 class Command(BaseCommand):
     help = 'Seed the database with sample order data'
@@ -49,107 +48,137 @@ class Command(BaseCommand):
         self.stdout.write(self.style.WARNING('🌱 Starting order database seeding...'))
         
         try:
-            with transaction.atomic():
-                # Clear existing data if requested
-                if clear_data:
-                    self.stdout.write('🗑️  Clearing existing orders...')
-                    Order.objects.all().delete()
-                    self.stdout.write(self.style.SUCCESS('✅ Orders cleared'))
-                
-                # Check if data already exists
-                if Order.objects.exists() and not clear_data:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            '⚠️  Database already contains orders. Use --clear to reset.'
-                        )
-                    )
-                    return
-                
-                # Educational Note: We create orders in different statuses
-                # to simulate a realistic order lifecycle
-                
-                # Calculate distribution
-                pending_count = int(num_orders * 0.3)  # 30% pending
-                confirmed_count = int(num_orders * 0.2)  # 20% confirmed
-                shipped_count = int(num_orders * 0.2)  # 20% shipped
-                delivered_count = num_orders - pending_count - confirmed_count - shipped_count  # Rest delivered
-                
-                # Create pending orders
-                self.stdout.write(f'📦 Creating {pending_count} pending orders...')
-                pending_orders = PendingOrderFactory.create_batch(pending_count)
+            # Educational Note: There is no single transaction around the
+            # whole seed. Clearing and each status batch commit on their
+            # own, which keeps transactions (and the WAL they generate on
+            # PostgreSQL) small; a failure only rolls back the current batch.
+            
+            # Clear existing data if requested
+            if clear_data:
+                self.stdout.write('🗑️  Clearing existing orders...')
+                with transaction.atomic():
+                    if connection.vendor == 'postgresql':
+                        # Educational Note: TRUNCATE drops all rows at once,
+                        # while delete() collects the rows and cascades to
+                        # order items in Python first. RESTART IDENTITY also
+                        # resets the ids, so seeded ids are reproducible.
+                        with connection.cursor() as cursor:
+                            cursor.execute(
+                                f'TRUNCATE TABLE {Order._meta.db_table}, '
+                                f'{OrderItem._meta.db_table} RESTART IDENTITY CASCADE'
+                            )
+                    else:
+                        Order.objects.all().delete()
+                self.stdout.write(self.style.SUCCESS('✅ Orders cleared'))
+            
+            # Check if data already exists
+            if Order.objects.exists() and not clear_data:
                 self.stdout.write(
-                    self.style.SUCCESS(f'✅ Created {len(pending_orders)} pending orders')
-                )
-                
-                # Create confirmed orders
-                self.stdout.write(f'✅ Creating {confirmed_count} confirmed orders...')
-                confirmed_orders = ConfirmedOrderFactory.create_batch(confirmed_count)
-                self.stdout.write(
-                    self.style.SUCCESS(f'✅ Created {len(confirmed_orders)} confirmed orders')
+                    self.style.WARNING(
+                        '⚠️  Database already contains orders. Use --clear to reset.'
+                    )
                 )
+                return
+            
+            # Educational Note: We create orders in different statuses
+            # to simulate a realistic order lifecycle
+            
+            # Calculate distribution
+            pending_count = int(num_orders * 0.3)  # 30% pending
+            confirmed_count = int(num_orders * 0.2)  # 20% confirmed
+            shipped_count = int(num_orders * 0.2)  # 20% shipped
+            delivered_count = num_orders - pending_count - confirmed_count - shipped_count  # Rest delivered
+            
+            status_plan = [
+                ('pending', '📦', pending_count),
+                ('confirmed', '✅', confirmed_count),
+                ('shipped', '🚚', shipped_count),
+                ('delivered', '📬', delivered_count),
+            ]
+            
+            # Educational Note: Orders and items are built in memory and
+            # inserted with bulk_create (one statement per BULK_BATCH_SIZE
+            # rows), instead of several INSERT/UPDATE round-trips per order.
+            # Items point at their (still unsaved) order; Django fills in
+            # order_id from the primary keys bulk_create assigns to the orders.
+            # Totals are summed from the built items before the orders
+            # are inserted, so they are written by the same INSERT -
+            # no follow-up UPDATE (or DB-side SUM subquery) is needed.
+            for status, icon, count in status_plan:
+                self.stdout.write(f'{icon} Creating {count} {status} orders...')
+                orders = OrderFactory.build_batch(count, status=status)
+                items = []
+                for order in orders:
+                    order_items = OrderItemFactory.build_batch(
+                        random.randint(1, 5), order=order
+                    )
+                    order.total_amount = sum(item.subtotal for item in order_items)
+                    items.extend(order_items)
                 
-                # Create shipped orders
-                self.stdout.write(f'🚚 Creating {shipped_count} shipped orders...')
-                shipped_orders = ShippedOrderFactory.create_batch(shipped_count)
-                self.stdout.write(
-                    self.style.SUCCESS(f'✅ Created {len(shipped_orders)} shipped orders')
-                )
+                # Each status commits on its own; its orders and items
+                # are saved together or not at all
+                with transaction.atomic():
+                    Order.objects.bulk_create(orders, batch_size=BULK_BATCH_SIZE)
+                    OrderItem.objects.bulk_create(items, batch_size=BULK_BATCH_SIZE)
                 
-                # Create delivered orders
-                self.stdout.write(f'📬 Creating {delivered_count} delivered orders...')
-                delivered_orders = DeliveredOrderFactory.create_batch(delivered_count)
                 self.stdout.write(
-                    self.style.SUCCESS(f'✅ Created {len(delivered_orders)} delivered orders')
+                    self.style.SUCCESS(f'✅ Created {count} {status} orders')
                 )
-                
-                # Summary
-                total_orders = Order.objects.count()
-                total_items = OrderItem.objects.count()
-                
-                # Status breakdown
-                status_counts = {}
-                for status_code, status_name in Order.STATUS_CHOICES:
-                    count = Order.objects.filter(status=status_code).count()
-                    status_counts[status_name] = count
-                
-                # Calculate total revenue
-                from decimal import Decimal
-                total_revenue = sum(
-                    order.total_amount for order in Order.objects.all()
-                )
-                
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'\n🎉 Order database seeding complete!'
-                    )
+            
+            # Summary
+            # Educational Note: One GROUP BY and one SUM replace a COUNT
+            # per status and loading every order into Python.
+            counts_by_status = dict(
+                Order.objects.order_by()
+                .values_list('status')
+                .annotate(count=Count('id'))
+            )
+            status_counts = {
+                status_name: counts_by_status.get(status_code, 0)
+                for status_code, status_name in Order.STATUS_CHOICES
+            }
+            total_orders = sum(counts_by_status.values())
+            total_items = OrderItem.objects.count()
+            
+            # Calculate total revenue
+            from decimal import Decimal
+            total_revenue = (
+                Order.objects.aggregate(total=Sum('total_amount'))['total']
+                or Decimal('0')
+            )
+            
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'\n🎉 Order database seeding complete!'
                 )
-                self.stdout.write(f'   Total orders: {total_orders}')
-                self.stdout.write(f'   Total order items: {total_items}')
-                self.stdout.write(f'   Total revenue: ${total_revenue:,.2f}')
-                
-                self.stdout.write('\n📊 Orders by status:')
-                for status_name, count in status_counts.items():
-                    if count > 0:
-                        self.stdout.write(f'   {status_name}: {count}')
-                
-                # Show sample orders
-                self.stdout.write('\n📝 Sample orders:')
-                for order in Order.objects.all()[:5]:
-                    item_count = order.items.count()
-                    self.stdout.write(
-                        f'   Order #{order.id} - User {order.user_id} - '
-                        f'${order.total_amount} - {order.status} - {item_count} items'
-                    )
-                
+            )
+            self.stdout.write(f'   Total orders: {total_orders}')
+            self.stdout.write(f'   Total order items: {total_items}')
+            self.stdout.write(f'   Total revenue: ${total_revenue:,.2f}')
+            
+            self.stdout.write('\n📊 Orders by status:')
+            for status_name, count in status_counts.items():
+                if count > 0:
+                    self.stdout.write(f'   {status_name}: {count}')
+            
+            # Show sample orders
+            self.stdout.write('\n📝 Sample orders:')
+            sample_orders = Order.objects.annotate(item_count=Count('items'))[:5]
+            for order in sample_orders:
                 self.stdout.write(
-                    self.style.WARNING(
-                        '\n⚠️  Note: Orders reference users (1-10) and products (1-20).'
-                    )
+                    f'   Order #{order.id} - User {order.user_id} - '
+                    f'${order.total_amount} - {order.status} - {order.item_count} items'
                 )
-                self.stdout.write(
-                    '   Make sure UserService and ProductService are seeded first!'
+            
+            self.stdout.write(
+                self.style.WARNING(
+                    '\n⚠️  Note: Orders reference users (1-10) and products (1-20).'
                 )
-                
+            )
+            self.stdout.write(
+                '   Make sure UserService and ProductService are seeded first!'
+            )
+            
         except Exception as e:
             self.stdout.write(
                 self.style.ERROR(f'❌ Error seeding database: {e}')
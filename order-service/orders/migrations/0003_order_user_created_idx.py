@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-15 18:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_alter_order_user_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user_id', '-created_at'], name='order_user_created_idx'),
+        ),
+    ]
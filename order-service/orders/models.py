@@ -56,10 +56,14 @@ class Order(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
-        ordering = ['-created_at']
+        # No default ordering: it would add ORDER BY created_at DESC to every
+        # query. Views that show orders in order ask for it explicitly.
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['status']),
+            # Matches the order list query (WHERE user_id = ... ORDER BY
+            # created_at DESC), so it's a single index range scan, no sort
+            models.Index(fields=['user_id', '-created_at'], name='order_user_created_idx'),
         ]
     
     def __str__(self):
@@ -118,5 +122,14 @@ class OrderItem(models.Model):
     
     @property
     def subtotal(self):
-        """Calculate subtotal for this order item."""
+        """
+        Calculate subtotal for this order item.
+        
+        Educational Note: Querysets that annotate subtotal_db (see
+        OrderViewSet.get_queryset) have the database compute it; otherwise,
+        e.g. for items that were just created, it is computed here.
+        """
+        subtotal = self.__dict__.get('subtotal_db')
+        if subtotal is not None:
+            return subtotal
         return self.quantity * self.price_at_purchase
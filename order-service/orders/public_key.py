@@ -0,0 +1,160 @@
+"""
+Background load of the JWT public key.
+
+Educational Note: settings.py only reads the key from disk, so neither
+startup nor a request ever waits on UserService. This thread fetches the key
+(from the shared Redis cache if another worker already has it, otherwise from
+UserService), saves it for the next start, and swaps it into the lazy
+JWT_PUBLIC_KEY object that simplejwt verifies with. It keeps retrying until
+a key is in place.
+"""
+
+import logging
+import os
+import threading
+import time
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import empty
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from order_service.settings import (
+    JWT_PUBLIC_KEY,
+    load_jwt_public_key,
+    parse_jwt_public_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# Educational Note: A shared Session keeps the connection to UserService alive
+# between attempts, and urllib3's Retry handles the exponential backoff
+# (2s, 4s, 8s, ...) that used to be a hand-written loop.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=2,
+        status_forcelist=(500, 502, 503, 504),
+    ),
+)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+# Retry interval while there is no key at all (degraded mode)
+MISSING_KEY_RETRY_INTERVAL = 5  # seconds
+
+_loader_started = False
+_loader_lock = threading.Lock()
+
+
+def public_key_loaded():
+    """
+    True if a usable key is in place.
+    
+    Educational Note: Reads the lazy object's _wrapped slot directly, so it
+    never forces the load itself (the health check calls this). The object
+    comes from the settings module, not django.conf.settings: LazySettings
+    probes every cached value it returns (for _mask_wrapped), which would
+    force the load.
+    """
+    wrapped = JWT_PUBLIC_KEY._wrapped
+    return wrapped is not empty and wrapped is not None
+
+
+def fetch_public_key():
+    """
+    Fetch the PEM key: shared Redis cache first, then UserService.
+    
+    Returns None if neither has it.
+    """
+    # Educational Note: Every worker loads the key on its own. The first one
+    # to fetch it caches it, so siblings skip the HTTP call.
+    try:
+        public_key = cache.get(settings.JWT_PUBLIC_KEY_CACHE_KEY)
+        if public_key:
+            logger.info("✅ JWT public key loaded from cache")
+            return public_key
+    except Exception as e:
+        logger.warning("⚠️  Could not read public key from cache: %s", e)
+    
+    try:
+        logger.info("🔄 Fetching public key from UserService...")
+        response = _session.get(
+            f'{settings.USER_SERVICE_URL}/api/users/public-key/',
+            timeout=5
+        )
+        response.raise_for_status()
+        public_key = response.json()['public_key']
+    except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+        logger.error("❌ Failed to fetch public key after retries: %s", e)
+        return None
+    
+    try:
+        cache.set(
+            settings.JWT_PUBLIC_KEY_CACHE_KEY,
+            public_key,
+            settings.JWT_PUBLIC_KEY_CACHE_TIMEOUT,
+        )
+    except Exception as e:
+        logger.warning("⚠️  Could not cache public key: %s", e)
+    
+    # Save to local file for future use
+    try:
+        os.makedirs(os.path.dirname(settings.JWT_PUBLIC_KEY_PATH), exist_ok=True)
+        with open(settings.JWT_PUBLIC_KEY_PATH, 'w') as f:
+            f.write(public_key)
+        logger.info("✅ JWT public key fetched and saved to %s", settings.JWT_PUBLIC_KEY_PATH)
+    except OSError as e:
+        logger.warning("⚠️  Could not save public key to file: %s", e)
+    
+    return public_key
+
+
+def load_public_key():
+    """
+    Load the key once and put it in place. Returns True on success.
+    """
+    verifying_key = parse_jwt_public_key(load_jwt_public_key() or fetch_public_key())
+    if verifying_key is None:
+        return False
+    
+    # Educational Note: SIMPLE_JWT['VERIFYING_KEY'] and simplejwt's
+    # TokenBackend hold this same lazy object, so filling in _wrapped is
+    # enough for them to start verifying with the key. It also replaces a
+    # None left there by a request that forced the load before the key
+    # existed.
+    JWT_PUBLIC_KEY._wrapped = verifying_key
+    return True
+
+
+def _load_until_available():
+    # Checked again after each sleep: a request that forced the lazy load
+    # while the key was being put in place can overwrite it with None.
+    while not public_key_loaded():
+        try:
+            load_public_key()
+        except Exception:
+            logger.exception("❌ Public key load failed")
+        
+        time.sleep(MISSING_KEY_RETRY_INTERVAL)
+
+
+def start_public_key_loader():
+    """Start the load thread (once per process)."""
+    global _loader_started
+    
+    with _loader_lock:
+        if _loader_started:
+            return
+        _loader_started = True
+    
+    threading.Thread(
+        target=_load_until_available,
+        name='jwt-public-key-loader',
+        daemon=True,
+    ).start()
@@ -8,23 +8,79 @@ Educational Note: Serializers in Django REST Framework:
 - Similar to forms but designed for APIs
 """
 
+from copy import copy
+
+import fastjsonschema
+from django.utils import timezone
 from rest_framework import serializers
 from .models import Order, OrderItem
 from decimal import Decimal
 
+CENTS = Decimal('0.01')
+
+# A positive integer, or a string int() turns into one (e.g. "5", " 05 ")
+_POSITIVE_INTEGER = {
+    'anyOf': [
+        {'type': 'integer', 'minimum': 1},
+        {'type': 'string', 'pattern': r'^\s*\+?0*[1-9][0-9]*\s*$'},
+    ]
+}
+
+# Schema for OrderCreateSerializer's items
+ORDER_ITEMS_SCHEMA = {
+    'type': 'array',
+    'items': {
+        'type': 'object',
+        'required': ['product_id', 'quantity'],
+        'properties': {
+            'product_id': _POSITIVE_INTEGER,
+            'quantity': _POSITIVE_INTEGER,
+        },
+    },
+}
+
+# Educational Note: fastjsonschema turns the schema into Python source for a
+# straight-line validation function once, at import, instead of
+# interpreting rules on every call.
+_validate_order_items = fastjsonschema.compile(ORDER_ITEMS_SCHEMA)
 
-class OrderItemSerializer(serializers.ModelSerializer):
+# Unbound fields built by ModelSerializer.get_fields(), keyed by serializer class
+_FIELDS_CACHE = {}
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its fields once per class.
+    
+    Educational Note: ModelSerializer.get_fields() introspects the model
+    and builds every Field from scratch each time a serializer is created.
+    The result only depends on the serializer class, so we keep the first
+    result and hand each instance shallow copies (binding sets attributes
+    like parent and source on the field, so instances must not share one).
+    Nested serializers share their child between copies, which is fine for
+    the read-only nested fields used here.
+    """
+    
+    def get_fields(self):
+        cls = self.__class__
+        if cls not in _FIELDS_CACHE:
+            _FIELDS_CACHE[cls] = super().get_fields()
+        return {name: copy(field) for name, field in _FIELDS_CACHE[cls].items()}
+
+
+class OrderItemSerializer(CachedFieldsModelSerializer):
     """
     Serializer for OrderItem model.
     
     Educational Note: We include a computed field (subtotal) that's not
     stored in the database but calculated on-the-fly.
+    
+    subtotal is formatted directly as a 2-place string instead of going
+    through DecimalField, which validates digits, quantizes with a new
+    decimal Context and formats for every item.
     """
     
-    subtotal = serializers.DecimalField(
-        max_digits=10,
-        decimal_places=2,
-        read_only=True,
+    subtotal = serializers.SerializerMethodField(
         help_text="Calculated as quantity * price_at_purchase"
     )
     
@@ -32,9 +88,13 @@ class OrderItemSerializer(serializers.ModelSerializer):
         model = OrderItem
         fields = ['id', 'product_id', 'quantity', 'price_at_purchase', 'subtotal']
         read_only_fields = ['id', 'price_at_purchase', 'subtotal']
+    
+    def get_subtotal(self, obj) -> str:
+        """Subtotal as a string with 2 decimal places."""
+        return f'{obj.subtotal:.2f}'
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(CachedFieldsModelSerializer):
     """
     Serializer for Order model with nested order items.
     
@@ -79,32 +139,26 @@ class OrderCreateSerializer(serializers.Serializer):
         
         Educational Note: Custom validation in DRF serializers.
         This runs before the main validation logic.
+        
+        The items are checked against ORDER_ITEMS_SCHEMA by a validator
+        compiled at import. Items are checked in order, required keys before
+        values, so the first error reported is the same as checking each
+        item by hand.
         """
-        for item in value:
-            if 'product_id' not in item:
-                raise serializers.ValidationError("Each item must have a product_id")
-            if 'quantity' not in item:
-                raise serializers.ValidationError("Each item must have a quantity")
-            
-            # Validate types
-            try:
-                product_id = int(item['product_id'])
-                if product_id <= 0:
-                    raise ValueError()
-            except (ValueError, TypeError):
-                raise serializers.ValidationError("product_id must be a positive integer")
-            
-            try:
-                quantity = int(item['quantity'])
-                if quantity <= 0:
-                    raise ValueError()
-            except (ValueError, TypeError):
-                raise serializers.ValidationError("quantity must be a positive integer")
+        try:
+            _validate_order_items(value)
+        except fastjsonschema.JsonSchemaValueException as e:
+            # e.path is ['data', index] or ['data', index, field]
+            if len(e.path) > 2:
+                raise serializers.ValidationError(f"{e.path[2]} must be a positive integer")
+            item = value[int(e.path[1])]
+            missing = 'product_id' if 'product_id' not in item else 'quantity'
+            raise serializers.ValidationError(f"Each item must have a {missing}")
         
         return value
 
 
-class OrderListSerializer(serializers.ModelSerializer):
+class OrderListSerializer(CachedFieldsModelSerializer):
     """
     Serializer for order lists with nested items.
     
@@ -123,4 +177,76 @@ class OrderListSerializer(serializers.ModelSerializer):
     
     def get_item_count(self, obj):
         """Get count of items in the order."""
-        return obj.items.count()
+        # Annotated by OrderViewSet.get_queryset; otherwise len() of the
+        # (prefetched) items instead of a COUNT(*) query per order
+        item_count = getattr(obj, '_item_count', None)
+        if item_count is not None:
+            return item_count
+        return len(obj.items.all())
+    
+    def to_representation(self, instance):
+        """
+        Render the order with its items inline.
+        
+        Educational Note: The declared fields above describe the response,
+        but rendering through them builds a nested ListSerializer and an
+        OrderItemSerializer for every order. serialize_order_list() produces
+        the identical dict from the prefetched items in one pass.
+        """
+        return serialize_order_list([instance])[0]
+
+
+def _decimal_to_str(value):
+    """Format a Decimal the way DecimalField(decimal_places=2) does."""
+    return '{:f}'.format(value.quantize(CENTS))
+
+
+def _datetime_to_str(value):
+    """Format a datetime the way DRF's DateTimeField does (ISO 8601, 'Z' for UTC)."""
+    value = timezone.localtime(value).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def serialize_order_list(orders):
+    """
+    Build the OrderListSerializer representation with plain dicts.
+    
+    Educational Note: ModelSerializer creates and binds a set of Field
+    objects for every order and every nested item, which dominates CPU
+    time on list pages. The list endpoint builds the same JSON directly
+    from the (prefetched) model instances instead. OrderListSerializer
+    still documents the response shape for the API schema.
+    
+    Args:
+        orders: Order instances with prefetched items (and optionally an
+            _item_count annotation)
+    
+    Returns:
+        List of dicts, identical to OrderListSerializer(orders, many=True).data
+    """
+    data = []
+    for order in orders:
+        items = order.items.all()
+        item_count = getattr(order, '_item_count', None)
+        data.append({
+            'id': order.id,
+            'user_id': order.user_id,
+            'total_amount': _decimal_to_str(order.total_amount),
+            'status': order.status,
+            'items': [
+                {
+                    'id': item.id,
+                    'product_id': item.product_id,
+                    'quantity': item.quantity,
+                    'price_at_purchase': _decimal_to_str(item.price_at_purchase),
+                    'subtotal': f'{item.subtotal:.2f}',
+                }
+                for item in items
+            ],
+            'item_count': item_count if item_count is not None else len(items),
+            'created_at': _datetime_to_str(order.created_at),
+            'updated_at': _datetime_to_str(order.updated_at),
+        })
+    return data
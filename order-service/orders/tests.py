@@ -0,0 +1,155 @@
+"""
+Tests for OrderService.
+
+Educational Note: UserService and ProductService are replaced by mock
+clients, so these tests exercise the orchestration in OrderViewSet without
+any gRPC traffic.
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock
+
+from django.db.models import Count, Prefetch
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from .models import Order, OrderItem
+from .serializers import (
+    OrderItemSerializer,
+    OrderListSerializer,
+    serialize_order_list,
+)
+from .views import OrderViewSet
+
+USER = SimpleNamespace(id=7, is_authenticated=True)
+
+
+def _reservation(ok, *results):
+    """A reserve_inventory() result for (product_id, reserved, price_cents) items."""
+    return {
+        'ok': ok,
+        'results': [
+            {
+                'product_id': product_id,
+                'exists': True,
+                'reserved': reserved,
+                'price': f'{Decimal(price_cents).scaleb(-2):.2f}',
+                'price_cents': price_cents,
+                'available_quantity': 10 if reserved else 0,
+                'error_message': '' if reserved else 'Insufficient inventory',
+            }
+            for product_id, reserved, price_cents in results
+        ],
+    }
+
+
+class CreateOrderTests(TestCase):
+    """OrderViewSet.create() reserves inventory and releases it on failure."""
+
+    def setUp(self):
+        self.user_client = mock.Mock()
+        self.product_client = mock.Mock()
+        for name, client in (
+            ('get_user_service_client', self.user_client),
+            ('get_product_service_client', self.product_client),
+        ):
+            patcher = mock.patch(f'orders.views.{name}', return_value=client)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def create_order(self, items):
+        request = APIRequestFactory().post('/api/orders/', {'items': items}, format='json')
+        force_authenticate(request, user=USER)
+        return OrderViewSet.as_view({'post': 'create'})(request)
+
+    def test_creates_order_from_reservation(self):
+        self.user_client.validate_user.return_value = {'valid': True, 'error_message': ''}
+        self.product_client.reserve_inventory.return_value = _reservation(
+            True, (1, True, 1999), (2, True, 500)
+        )
+
+        response = self.create_order([
+            {'product_id': 1, 'quantity': 2},
+            {'product_id': 2, 'quantity': 1},
+        ])
+
+        self.assertEqual(response.status_code, 201)
+        self.product_client.reserve_inventory.assert_called_once_with([(1, 2), (2, 1)])
+        self.product_client.release_inventory.assert_not_called()
+        order = Order.objects.get()
+        self.assertEqual(order.user_id, '7')
+        self.assertEqual(order.total_amount, Decimal('44.98'))
+        self.assertEqual(order.items.count(), 2)
+
+    def test_releases_reservation_when_user_is_invalid(self):
+        self.user_client.validate_user.return_value = {'valid': False, 'error_message': 'User is inactive'}
+        self.product_client.reserve_inventory.return_value = _reservation(True, (1, True, 1999))
+
+        response = self.create_order([{'product_id': 1, 'quantity': 3}])
+
+        self.assertEqual(response.status_code, 400)
+        self.product_client.release_inventory.assert_called_once_with([(1, 3)])
+        self.assertFalse(Order.objects.exists())
+
+    def test_failed_reservation_is_not_released(self):
+        self.user_client.validate_user.return_value = {'valid': True, 'error_message': ''}
+        self.product_client.reserve_inventory.return_value = _reservation(
+            False, (1, True, 1999), (2, False, 500)
+        )
+
+        response = self.create_order([
+            {'product_id': 1, 'quantity': 1},
+            {'product_id': 2, 'quantity': 5},
+        ])
+
+        self.assertEqual(response.status_code, 400)
+        self.product_client.release_inventory.assert_not_called()
+        self.assertFalse(Order.objects.exists())
+
+
+class OrderListSerializationTests(TestCase):
+    """serialize_order_list() matches what OrderListSerializer's fields produce."""
+
+    def setUp(self):
+        for user_id, prices in (('7', ['19.99', '5.00']), ('7', []), ('8', ['0.10'])):
+            order = Order.objects.create(user_id=user_id, total_amount=Decimal('24.99'))
+            OrderItem.objects.bulk_create([
+                OrderItem(order=order, product_id=str(n), quantity=n + 1, price_at_purchase=Decimal(price))
+                for n, price in enumerate(prices)
+            ])
+
+    def test_matches_field_based_serializer(self):
+        orders = list(
+            Order.objects.prefetch_related(Prefetch('items', queryset=OrderItem.objects.all()))
+            .annotate(_item_count=Count('items'))
+            .order_by('id')
+        )
+        serializer = OrderListSerializer()
+
+        # super(OrderListSerializer, ...) renders through the declared
+        # fields, which OrderListSerializer.to_representation() bypasses
+        expected = [
+            super(OrderListSerializer, serializer).to_representation(order)
+            for order in orders
+        ]
+
+        self.assertEqual(serialize_order_list(orders), expected)
+
+    def test_item_count_without_annotation(self):
+        orders = list(Order.objects.prefetch_related('items').order_by('id'))
+
+        self.assertEqual([o['item_count'] for o in serialize_order_list(orders)], [2, 0, 1])
+
+
+class CachedFieldsModelSerializerTests(TestCase):
+    """Serializer instances get their own copies of the cached fields."""
+
+    def test_instances_do_not_share_bound_fields(self):
+        first = OrderItemSerializer()
+        second = OrderItemSerializer()
+
+        for name, field in first.fields.items():
+            self.assertIsNot(field, second.fields[name])
+            self.assertIs(field.parent, first)
+            self.assertIs(second.fields[name].parent, second)
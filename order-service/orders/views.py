@@ -9,19 +9,24 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from django.db import transaction
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Prefetch
 from decimal import Decimal
 import logging
 
 from .models import Order, OrderItem
+from .renderers import ORJSONRenderer
 from .serializers import (
     OrderSerializer,
     OrderCreateSerializer,
     OrderListSerializer,
+    serialize_order_list,
 )
 from .grpc_clients import (
     get_user_service_client,
     get_product_service_client,
+    get_rpc_executor,
     GRPCClientError,
 )
 from pybreaker import CircuitBreakerError
@@ -51,6 +56,13 @@ class OrderViewSet(viewsets.ModelViewSet):
     
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    
+    # Serializer per action; anything else uses OrderSerializer
+    _SERIALIZER_BY_ACTION = {
+        'list': OrderListSerializer,
+        'create': OrderCreateSerializer,
+    }
     
     def get_queryset(self):
         """
@@ -58,13 +70,44 @@ class OrderViewSet(viewsets.ModelViewSet):
         
         Educational Note: This ensures users can only see their own orders.
         The queryset is automatically filtered by user_id from JWT token.
+        
+        Items are loaded with prefetch_related: one extra query for the
+        whole page instead of one per order (the N+1 query problem).
+        Each item's subtotal is computed by the database in that query.
+        For the list view the item count is computed by the database in
+        the same SELECT (COUNT ... GROUP BY), not per order in Python.
         """
         if not self.request.user or not self.request.user.is_authenticated:
             return Order.objects.none()
         
         # Filter by authenticated user's ID
         user_id = str(self.request.user.id)
-        return Order.objects.filter(user_id=user_id)
+        queryset = Order.objects.filter(user_id=user_id).prefetch_related(
+            Prefetch(
+                'items',
+                queryset=OrderItem.objects.only(
+                    'id', 'order_id', 'product_id', 'quantity', 'price_at_purchase'
+                ).annotate(
+                    # Read by OrderItem.subtotal
+                    subtotal_db=ExpressionWrapper(
+                        F('quantity') * F('price_at_purchase'),
+                        output_field=DecimalField(max_digits=12, decimal_places=2),
+                    )
+                ),
+            )
+        )
+        if self.action in ('list', 'retrieve'):
+            # Only the columns the serializers render; columns added to the
+            # model later aren't fetched for these read-only views
+            queryset = queryset.only(
+                'id', 'user_id', 'total_amount', 'status', 'created_at', 'updated_at'
+            )
+        if self.action == 'list':
+            # Newest first (Order has no default ordering)
+            queryset = queryset.annotate(_item_count=Count('items')).order_by(
+                '-created_at'
+            )
+        return queryset
     
     def get_serializer_class(self):
         """
@@ -75,11 +118,45 @@ class OrderViewSet(viewsets.ModelViewSet):
         - Detail view: Full serializer (with nested items)
         - Create view: Custom validation serializer
         """
-        if self.action == 'list':
-            return OrderListSerializer
-        elif self.action == 'create':
-            return OrderCreateSerializer
-        return OrderSerializer
+        return self._SERIALIZER_BY_ACTION.get(self.action, OrderSerializer)
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List the authenticated user's orders (paginated).
+        
+        Educational Note: The response has the same shape as
+        OrderListSerializer, but is built with serialize_order_list(),
+        which skips DRF's per-row Field machinery.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serialize_order_list(page))
+        
+        return Response(serialize_order_list(queryset))
+    
+    def _release_reservation(self, product_client, reservation_future, requested):
+        """
+        Give back inventory reserved for an order that wasn't created.
+        
+        Educational Note: This is the compensating action for
+        ReserveInventory. It is best-effort: a failure is logged for
+        reconciliation instead of hiding the error that got us here.
+        """
+        try:
+            reservation = reservation_future.result()
+        except Exception:
+            return  # The reservation itself failed, so nothing was taken
+        
+        if not reservation['ok']:
+            return
+        
+        try:
+            if not product_client.release_inventory(requested):
+                raise GRPCClientError("ProductService did not release the inventory")
+        except Exception as e:
+            logger.error(f"❌ Failed to release reserved inventory {requested}: {e}")
     
     def create(self, request, *args, **kwargs):
         """
@@ -90,7 +167,10 @@ class OrderViewSet(viewsets.ModelViewSet):
         2. Validate input data (items)
         3. Validate user exists (UserService via gRPC)
         4. Validate products exist (ProductService via gRPC)
-        5. Check inventory availability (ProductService via gRPC)
+        5. Reserve inventory (ProductService via gRPC)
+           (steps 3-5 run concurrently, so the wait is the slower of the
+           two services, not their sum; the reservation is released
+           again if the order isn't created)
         6. Calculate total amount
         7. Create order and order items in a transaction
         
@@ -137,95 +217,122 @@ class OrderViewSet(viewsets.ModelViewSet):
         logger.info(f"📦 Creating order for user {user_id} with {len(items_data)} items")
         
         try:
-            # Step 3: Validate user exists via gRPC
-            # Educational Note: This is a synchronous gRPC call to UserService
-            # The @retry decorator handles transient failures automatically
+            # Educational Note: The user check and the inventory reservation
+            # don't depend on each other, so both are started at once and run
+            # concurrently over the shared gRPC channels. Errors raised in a
+            # worker (GRPCClientError, CircuitBreakerError) are re-raised by
+            # .result() and handled by the except clauses below.
             # The @circuit_breaker decorator prevents repeated calls to failing service
             user_client = get_user_service_client()
-            user_result = user_client.validate_user(user_id)
-            
-            if not user_result['valid']:
-                logger.warning(f"❌ User validation failed: {user_result['error_message']}")
-                return Response(
-                    {
-                        'error': 'User validation failed',
-                        'detail': user_result['error_message']
-                    },
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+            product_client = get_product_service_client()
+            executor = get_rpc_executor()
             
-            logger.info(f"✅ User {user_id} validated")
+            # Educational Note: ReserveInventory checks that every product
+            # exists, returns its price and takes the stock in one atomic
+            # step on ProductService. A separate availability check would
+            # leave a window in which another order could take the same
+            # stock before this one is saved.
+            requested = [
+                (int(item_data['product_id']), int(item_data['quantity']))
+                for item_data in items_data
+            ]
             
-            # Step 4 & 5: Validate products and check availability
-            product_client = get_product_service_client()
-            validated_items = []
-            total_amount = Decimal('0.00')
+            user_future = executor.submit(user_client.validate_user, user_id)
+            reservation_future = executor.submit(
+                product_client.reserve_inventory, requested
+            )
             
-            for item_data in items_data:
-                product_id = int(item_data['product_id'])
-                quantity = int(item_data['quantity'])
-                
-                # Get product info
-                product_result = product_client.get_product_info(product_id)
+            order = None
+            try:
+                # Step 3: Validate user exists via gRPC
+                user_result = user_future.result()
                 
-                if not product_result['exists']:
-                    logger.warning(f"❌ Product {product_id} not found")
+                if not user_result['valid']:
+                    logger.warning(f"❌ User validation failed: {user_result['error_message']}")
                     return Response(
                         {
-                            'error': 'Product validation failed',
-                            'detail': f"Product {product_id} not found"
+                            'error': 'User validation failed',
+                            'detail': user_result['error_message']
                         },
                         status=status.HTTP_400_BAD_REQUEST
                     )
                 
-                product_info = product_result['product_info']
+                logger.info(f"✅ User {user_id} validated")
                 
-                # Check availability
-                availability_result = product_client.check_availability(product_id, quantity)
+                # Step 4 & 5: Validate products and reserve inventory
+                reservation = reservation_future.result()
+                # Educational Note: Prices are added up as integer cents
+                # and turned into Decimals once per value written, instead
+                # of parsing and multiplying a Decimal for every item.
+                validated_items = []
+                total_cents = 0
                 
-                if not availability_result['available']:
-                    logger.warning(f"❌ Product {product_id} not available in requested quantity")
-                    return Response(
-                        {
-                            'error': 'Insufficient inventory',
-                            'detail': f"Product {product_id} only has {availability_result['available_quantity']} units available"
-                        },
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
+                for (product_id, quantity), item_result in zip(requested, reservation['results']):
+                    if not item_result['exists']:
+                        logger.warning(f"❌ Product {product_id} not found")
+                        return Response(
+                            {
+                                'error': 'Product validation failed',
+                                'detail': f"Product {product_id} not found"
+                            },
+                            status=status.HTTP_400_BAD_REQUEST
+                        )
+                    
+                    if not item_result['reserved']:
+                        logger.warning(f"❌ Product {product_id} not available in requested quantity")
+                        return Response(
+                            {
+                                'error': 'Insufficient inventory',
+                                'detail': f"Product {product_id} only has {item_result['available_quantity']} units available"
+                            },
+                            status=status.HTTP_400_BAD_REQUEST
+                        )
+                    
+                    # Calculate item total
+                    price_cents = item_result['price_cents']
+                    total_cents += price_cents * quantity
+                    price = Decimal(price_cents).scaleb(-2)
+                    
+                    validated_items.append({
+                        'product_id': str(product_id),
+                        'quantity': quantity,
+                        'price_at_purchase': price,
+                    })
+                    
+                    logger.info(f"✅ Product {product_id} reserved (qty: {quantity}, price: {price})")
                 
-                # Calculate item total
-                price = Decimal(product_info['price'])
-                item_total = price * quantity
-                total_amount += item_total
+                if not reservation['ok']:
+                    raise GRPCClientError("Inventory reservation failed")
                 
-                validated_items.append({
-                    'product_id': str(product_id),
-                    'quantity': quantity,
-                    'price_at_purchase': price,
-                })
+                total_amount = Decimal(total_cents).scaleb(-2)
                 
-                logger.info(f"✅ Product {product_id} validated (qty: {quantity}, price: {price})")
-            
-            # Step 6: Create order and order items in a transaction
-            # Educational Note: Database transaction ensures atomicity
-            # Either all records are created, or none are (no partial orders)
-            with transaction.atomic():
-                # Create order
-                order = Order.objects.create(
-                    user_id=str(user_id),  # Will be encrypted automatically
-                    total_amount=total_amount,
-                    status='pending'
-                )
-                
-                # Create order items
-                for item_data in validated_items:
-                    OrderItem.objects.create(
-                        order=order,
-                        **item_data
+                # Step 6: Create order and order items in a transaction
+                # Educational Note: Database transaction ensures atomicity
+                # Either all records are created, or none are (no partial orders)
+                with transaction.atomic():
+                    # Create order
+                    new_order = Order.objects.create(
+                        user_id=str(user_id),  # Will be encrypted automatically
+                        total_amount=total_amount,
+                        status='pending'
+                    )
+                    
+                    # Create order items
+                    # Educational Note: bulk_create sends one multi-row INSERT
+                    # instead of one INSERT per item
+                    OrderItem.objects.bulk_create(
+                        [OrderItem(order=new_order, **item_data) for item_data in validated_items],
+                        batch_size=500,
                     )
                 
+                order = new_order
                 logger.info(f"✅ Order {order.id} created successfully (total: ${total_amount})")
             
+            finally:
+                # Any path that didn't create the order gives the stock back
+                if order is None:
+                    self._release_reservation(product_client, reservation_future, requested)
+            
             # Return created order
             response_serializer = OrderSerializer(order)
             return Response(
@@ -13,7 +13,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rproduct.proto\x12\x07product\"D\n\x12ProductInfoRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\x05\x12\x1a\n\x12requesting_service\x18\x02 \x01(\t\"h\n\x13ProductInfoResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\x12*\n\x0cproduct_info\x18\x02 \x01(\x0b\x32\x14.product.ProductInfo\x12\x15\n\rerror_message\x18\x03 \x01(\t\"z\n\x0bProductInfo\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\r\n\x05price\x18\x04 \x01(\t\x12\x17\n\x0finventory_count\x18\x05 \x01(\x05\x12\x14\n\x0cis_available\x18\x06 \x01(\x08\"W\n\x13\x41vailabilityRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\x05\x12\x10\n\x08quantity\x18\x02 \x01(\x05\x12\x1a\n\x12requesting_service\x18\x03 \x01(\t\"\\\n\x14\x41vailabilityResponse\x12\x11\n\tavailable\x18\x01 \x01(\x08\x12\x1a\n\x12\x61vailable_quantity\x18\x02 \x01(\x05\x12\x15\n\rerror_message\x18\x03 \x01(\t2\xaf\x01\n\x0eProductService\x12K\n\x0eGetProductInfo\x12\x1b.product.ProductInfoRequest\x1a\x1c.product.ProductInfoResponse\x12P\n\x11\x43heckAvailability\x12\x1c.product.AvailabilityRequest\x1a\x1d.product.AvailabilityResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rproduct.proto\x12\x07product\"D\n\x12ProductInfoRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\x05\x12\x1a\n\x12requesting_service\x18\x02 \x01(\t\"h\n\x13ProductInfoResponse\x12\x0e\n\x06\x65xists\x18\x01 \x01(\x08\x12*\n\x0cproduct_info\x18\x02 \x01(\x0b\x32\x14.product.ProductInfo\x12\x15\n\rerror_message\x18\x03 \x01(\t\"\x8f\x01\n\x0bProductInfo\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\r\n\x05price\x18\x04 \x01(\t\x12\x17\n\x0finventory_count\x18\x05 \x01(\x05\x12\x14\n\x0cis_available\x18\x06 \x01(\x08\x12\x13\n\x0bprice_cents\x18\x07 \x01(\x03\"W\n\x13\x41vailabilityRequest\x12\x12\n\nproduct_id\x18\x01 \x01(\x05\x12\x10\n\x08quantity\x18\x02 \x01(\x05\x12\x1a\n\x12requesting_service\x18\x03 \x01(\t\"\\\n\x14\x41vailabilityResponse\x12\x11\n\tavailable\x18\x01 \x01(\x08\x12\x1a\n\x12\x61vailable_quantity\x18\x02 \x01(\x05\x12\x15\n\rerror_message\x18\x03 \x01(\t\"7\n\x0fProductQuantity\x12\x12\n\nproduct_id\x18\x01 \x01(\x05\x12\x10\n\x08quantity\x18\x02 \x01(\x05\"^\n\x17ReserveInventoryRequest\x12\'\n\x05items\x18\x01 \x03(\x0b\x32\x18.product.ProductQuantity\x12\x1a\n\x12requesting_service\x18\x02 \x01(\t\"\xa0\x01\n\x11ReservationResult\x12\x12\n\nproduct_id\x18\x01 \x01(\x05\x12\x0e\n\x06\x65xists\x18\x02 \x01(\x08\x12\x10\n\x08reserved\x18\x03 \x01(\x08\x12\r\n\x05price\x18\x04 \x01(\t\x12\x1a\n\x12\x61vailable_quantity\x18\x05 \x01(\x05\x12\x15\n\rerror_message\x18\x06 \x01(\t\x12\x13\n\x0bprice_cents\x18\x07 \x01(\x03\"S\n\x18ReserveInventoryResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x12+\n\x07results\x18\x02 \x03(\x0b\x32\x1a.product.ReservationResult\"^\n\x17ReleaseInventoryRequest\x12\'\n\x05items\x18\x01 \x03(\x0b\x32\x18.product.ProductQuantity\x12\x1a\n\x12requesting_service\x18\x02 \x01(\t\"&\n\x18ReleaseInventoryResponse\x12\n\n\x02ok\x18\x01 \x01(\x08\x32\xe1\x02\n\x0eProductService\x12K\n\x0eGetProductInfo\x12\x1b.product.ProductInfoRequest\x1a\x1c.product.ProductInfoResponse\x12P\n\x11\x43heckAvailability\x12\x1c.product.AvailabilityRequest\x1a\x1d.product.AvailabilityResponse\x12W\n\x10ReserveInventory\x12 .product.ReserveInventoryRequest\x1a!.product.ReserveInventoryResponse\x12W\n\x10ReleaseInventory\x12 .product.ReleaseInventoryRequest\x1a!.product.ReleaseInventoryResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -24,12 +24,24 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _globals['_PRODUCTINFOREQUEST']._serialized_end=94
   _globals['_PRODUCTINFORESPONSE']._serialized_start=96
   _globals['_PRODUCTINFORESPONSE']._serialized_end=200
-  _globals['_PRODUCTINFO']._serialized_start=202
-  _globals['_PRODUCTINFO']._serialized_end=324
-  _globals['_AVAILABILITYREQUEST']._serialized_start=326
-  _globals['_AVAILABILITYREQUEST']._serialized_end=413
-  _globals['_AVAILABILITYRESPONSE']._serialized_start=415
-  _globals['_AVAILABILITYRESPONSE']._serialized_end=507
-  _globals['_PRODUCTSERVICE']._serialized_start=510
-  _globals['_PRODUCTSERVICE']._serialized_end=685
+  _globals['_PRODUCTINFO']._serialized_start=203
+  _globals['_PRODUCTINFO']._serialized_end=346
+  _globals['_AVAILABILITYREQUEST']._serialized_start=348
+  _globals['_AVAILABILITYREQUEST']._serialized_end=435
+  _globals['_AVAILABILITYRESPONSE']._serialized_start=437
+  _globals['_AVAILABILITYRESPONSE']._serialized_end=529
+  _globals['_PRODUCTQUANTITY']._serialized_start=531
+  _globals['_PRODUCTQUANTITY']._serialized_end=586
+  _globals['_RESERVEINVENTORYREQUEST']._serialized_start=588
+  _globals['_RESERVEINVENTORYREQUEST']._serialized_end=682
+  _globals['_RESERVATIONRESULT']._serialized_start=685
+  _globals['_RESERVATIONRESULT']._serialized_end=845
+  _globals['_RESERVEINVENTORYRESPONSE']._serialized_start=847
+  _globals['_RESERVEINVENTORYRESPONSE']._serialized_end=930
+  _globals['_RELEASEINVENTORYREQUEST']._serialized_start=932
+  _globals['_RELEASEINVENTORYREQUEST']._serialized_end=1026
+  _globals['_RELEASEINVENTORYRESPONSE']._serialized_start=1028
+  _globals['_RELEASEINVENTORYRESPONSE']._serialized_end=1066
+  _globals['_PRODUCTSERVICE']._serialized_start=1069
+  _globals['_PRODUCTSERVICE']._serialized_end=1422
 # @@protoc_insertion_point(module_scope)
@@ -25,6 +25,16 @@ class ProductServiceStub(object):
                 request_serializer=product__pb2.AvailabilityRequest.SerializeToString,
                 response_deserializer=product__pb2.AvailabilityResponse.FromString,
                 )
+        self.ReserveInventory = channel.unary_unary(
+                '/product.ProductService/ReserveInventory',
+                request_serializer=product__pb2.ReserveInventoryRequest.SerializeToString,
+                response_deserializer=product__pb2.ReserveInventoryResponse.FromString,
+                )
+        self.ReleaseInventory = channel.unary_unary(
+                '/product.ProductService/ReleaseInventory',
+                request_serializer=product__pb2.ReleaseInventoryRequest.SerializeToString,
+                response_deserializer=product__pb2.ReleaseInventoryResponse.FromString,
+                )
 
 
 class ProductServiceServicer(object):
@@ -45,6 +55,20 @@ class ProductServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ReserveInventory(self, request, context):
+        """Atomically check and decrement inventory for all items of an order
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReleaseInventory(self, request, context):
+        """Return previously reserved inventory (compensates ReserveInventory)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ProductServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -58,6 +82,16 @@ def add_ProductServiceServicer_to_server(servicer, server):
                     request_deserializer=product__pb2.AvailabilityRequest.FromString,
                     response_serializer=product__pb2.AvailabilityResponse.SerializeToString,
             ),
+            'ReserveInventory': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReserveInventory,
+                    request_deserializer=product__pb2.ReserveInventoryRequest.FromString,
+                    response_serializer=product__pb2.ReserveInventoryResponse.SerializeToString,
+            ),
+            'ReleaseInventory': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReleaseInventory,
+                    request_deserializer=product__pb2.ReleaseInventoryRequest.FromString,
+                    response_serializer=product__pb2.ReleaseInventoryResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'product.ProductService', rpc_method_handlers)
@@ -102,3 +136,37 @@ class ProductService(object):
             product__pb2.AvailabilityResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ReserveInventory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/product.ProductService/ReserveInventory',
+            product__pb2.ReserveInventoryRequest.SerializeToString,
+            product__pb2.ReserveInventoryResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ReleaseInventory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/product.ProductService/ReleaseInventory',
+            product__pb2.ReleaseInventoryRequest.SerializeToString,
+            product__pb2.ReleaseInventoryResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -5,12 +5,15 @@ Educational Note: This server handles inter-service communication.
 OrderService calls these methods to validate products and check inventory.
 """
 
+import hmac
 import os
 import sys
 import logging
+import multiprocessing
+import signal
+import threading
 import grpc
 from concurrent import futures
-import time
 from decimal import Decimal
 
 # Add Django project to Python path
@@ -21,14 +24,238 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'product_service.settings')
 import django
 django.setup()
 
+from cachetools import TTLCache
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from products.list_cache import invalidate_product_list
 from products.models import Product
 from grpc_generated import product_pb2, product_pb2_grpc
 
 logger = logging.getLogger(__name__)
 
+# Seconds in-flight RPCs get to finish when the server is stopped
+SHUTDOWN_GRACE = 10
+
 # Shared secret for service-to-service authentication
 SERVICE_SECRET = os.getenv('SERVICE_SECRET', 'shared-secret-key-change-in-production')
 
+# Educational Note: Each in-flight RPC occupies one worker thread for its
+# whole duration, so the pool size is the server's concurrency limit. The
+# RPCs here mostly wait on the database rather than use the CPU, so the
+# default is several threads per core (with a floor for small hosts).
+# Each worker thread also holds its own database connection, so keep
+# GRPC_PROCESSES * GRPC_MAX_WORKERS below the database's connection limit.
+GRPC_MAX_WORKERS = int(os.getenv('GRPC_MAX_WORKERS', max(32, (os.cpu_count() or 1) * 8)))
+
+# Educational Note: Threads share one GIL, so a single server process uses
+# at most one core for Python work (protobuf, ORM). serve() starts this many
+# server processes, all listening on the same port via SO_REUSEPORT; the
+# kernel spreads incoming connections across them. Each process has its
+# own thread pool and product cache.
+# Multiple processes are opt-in: every process can open GRPC_MAX_WORKERS
+# database connections (about 8 x 64 = 512 on an 8-core host, far above
+# PostgreSQL's default max_connections of 100), os.cpu_count() ignores
+# container CPU limits, and on SQLite the processes would all contend for
+# the same database file. Raise it only on PostgreSQL, after sizing
+# GRPC_PROCESSES * GRPC_MAX_WORKERS to the connection budget.
+GRPC_PROCESSES = int(os.getenv('GRPC_PROCESSES', '1'))
+
+# Educational Note: Admission control. Without a limit, calls that find
+# every worker busy wait in an unbounded queue, so under overload latency
+# (and memory) grows without bound. With maximum_concurrent_rpcs, calls
+# beyond the limit are rejected right away with RESOURCE_EXHAUSTED, which
+# the caller's retry/circuit breaker can handle - the same idea as
+# Netflix's concurrency-limits library. The limit is above GRPC_MAX_WORKERS
+# to allow a short queue for bursts.
+GRPC_MAX_CONCURRENT_RPCS = int(os.getenv('GRPC_MAX_CONCURRENT_RPCS', max(200, GRPC_MAX_WORKERS * 2)))
+
+# Educational Note: OrderService keeps one long-lived channel per service
+# and pings it every 30s, even when idle (see GRPC_CHANNEL_OPTIONS in
+# orders/grpc_clients.py). By default a server only accepts a ping without
+# data every 5 minutes and doesn't expect pings with no call in flight, so
+# it would answer those pings with GOAWAY (too_many_pings) and the client
+# would have to reconnect - the handshake the shared channel is there to
+# avoid. These options accept the client's keepalive pings.
+GRPC_KEEPALIVE_OPTIONS = [
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.min_ping_interval_without_data_ms', 10000),
+]
+
+GRPC_SERVER_OPTIONS = [
+    ('grpc.so_reuseport', 1),
+    ('grpc.max_concurrent_streams', 1000),
+    *GRPC_KEEPALIVE_OPTIONS,
+]
+
+# Educational Note: Product details rarely change, so GetProductInfo keeps
+# each ProductInfo in a small in-process TTL cache, already serialized. A hit
+# skips the SQL query and model/message construction, and parsing the bytes
+# into the response happens in one C call instead of setting each field from
+# Python. Entries are evicted
+# when this process changes a product (signals, reservations), and the TTL
+# bounds how stale they can get after changes made elsewhere (e.g. the
+# REST API, which runs in a different process).
+PRODUCT_CACHE_SIZE = 10_000
+PRODUCT_CACHE_TTL = 30  # seconds
+
+_product_cache = TTLCache(maxsize=PRODUCT_CACHE_SIZE, ttl=PRODUCT_CACHE_TTL)
+_product_cache_lock = threading.RLock()
+
+
+def _evict_products(product_ids):
+    """Drop cached ProductInfo messages for these products."""
+    with _product_cache_lock:
+        for product_id in product_ids:
+            _product_cache.pop(product_id, None)
+
+
+def _evict_product(sender, instance, **kwargs):
+    """post_save/post_delete receiver for Product."""
+    _evict_products([instance.pk])
+
+
+post_save.connect(_evict_product, sender=Product, dispatch_uid='grpc_product_cache_save')
+post_delete.connect(_evict_product, sender=Product, dispatch_uid='grpc_product_cache_delete')
+
+
+# Columns ProductInfo is built from
+PRODUCT_INFO_FIELDS = ('id', 'name', 'description', 'price', 'inventory_count')
+
+
+def _product_info_message(row):
+    """Build the ProductInfo message for a product row (a values() dict)."""
+    # Educational Note: Convert Decimal to string to avoid precision issues
+    # Protocol Buffers don't have a native Decimal type
+    price = row['price']
+    return product_pb2.ProductInfo(
+        id=row['id'],
+        name=row['name'],
+        description=row['description'],
+        price=str(price),  # Decimal → string
+        price_cents=int(price.scaleb(2)),  # Exact: price has 2 decimal places
+        inventory_count=row['inventory_count'],
+        is_available=row['inventory_count'] > 0  # Same rule as Product.is_available
+    )
+
+
+def _product_info_bytes(product_ids):
+    """
+    Serialized ProductInfo messages for these products, by id.
+    
+    Served from the cache where possible; the rest are loaded in one query
+    and cached. Products that don't exist are missing from the result.
+    """
+    with _product_cache_lock:
+        found = {}
+        for product_id in product_ids:
+            product_info = _product_cache.get(product_id)
+            if product_info is not None:
+                found[product_id] = product_info
+    
+    missing = [product_id for product_id in product_ids if product_id not in found]
+    if missing:
+        # Educational Note: values() returns plain dicts with only the
+        # columns ProductInfo needs, so no Product instances are built
+        rows = Product.objects.filter(id__in=missing).values(*PRODUCT_INFO_FIELDS)
+        
+        loaded = {
+            row['id']: _product_info_message(row).SerializeToString()
+            for row in rows
+        }
+        with _product_cache_lock:
+            _product_cache.update(loaded)
+        found.update(loaded)
+    
+    return found
+
+
+# Accepted 'authorization' values, checked the same way as in UserService's
+# grpc_server.py (see the note there): encoded once, compared in constant
+# time, rotation via SERVICE_SECRETS.
+_VALID_TOKEN_BYTES = frozenset(
+    f'Bearer {secret.strip()}'.encode()
+    for secret in os.getenv('SERVICE_SECRETS', SERVICE_SECRET).split(',')
+    if secret.strip()
+)
+
+
+def _is_authorized(metadata):
+    """
+    Check the caller's service credentials in the call's metadata.
+    
+    Educational Note: The metadata is scanned for the one key we need
+    instead of being copied into a dict.
+    """
+    for key, value in metadata:
+        if key == 'authorization':
+            token = value.encode()
+            return any(
+                len(token) == len(expected) and hmac.compare_digest(token, expected)
+                for expected in _VALID_TOKEN_BYTES
+            )
+    return False
+
+
+def _reject_unauthorized(request, context):
+    logger.warning(f"Unauthorized gRPC call from {request.requesting_service}")
+    context.abort(grpc.StatusCode.UNAUTHENTICATED, 'Invalid service credentials')
+
+
+class AuthInterceptor(grpc.ServerInterceptor):
+    """
+    Reject calls without valid service credentials.
+    
+    Educational Note: Every RPC needs the same check, so it runs here once,
+    before the call reaches the servicer (and before any database work).
+    Unauthorized calls get UNAUTHENTICATED from a stand-in handler, which
+    still deserializes the request so the caller can be logged.
+    """
+    
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or _is_authorized(handler_call_details.invocation_metadata):
+            return handler
+        
+        return grpc.unary_unary_rpc_method_handler(
+            _reject_unauthorized,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+
+class DatabaseConnectionInterceptor(grpc.ServerInterceptor):
+    """
+    Run Django's per-request connection cleanup around every RPC.
+    
+    Educational Note: Django closes connections that are past CONN_MAX_AGE
+    (or broken) when an HTTP request starts and finishes. gRPC calls don't
+    go through that request cycle, so without this each worker thread would
+    keep its connection forever, even after the database dropped it.
+    """
+    
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+        
+        behavior = handler.unary_unary
+        
+        def unary_unary(request, context):
+            close_old_connections()
+            try:
+                return behavior(request, context)
+            finally:
+                close_old_connections()
+        
+        return grpc.unary_unary_rpc_method_handler(
+            unary_unary,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
 
 class ProductServiceServicer(product_pb2_grpc.ProductServiceServicer):
     """
@@ -54,44 +281,24 @@ class ProductServiceServicer(product_pb2_grpc.ProductServiceServicer):
             ProductInfoResponse with product details
         """
         
-        # Verify service authentication
-        metadata = dict(context.invocation_metadata())
-        auth_token = metadata.get('authorization', '')
-        
-        if auth_token != f'Bearer {SERVICE_SECRET}':
-            logger.warning(f"Unauthorized gRPC call from {request.requesting_service}")
-            context.set_code(grpc.StatusCode.UNAUTHENTICATED)
-            context.set_details('Invalid service credentials')
-            return product_pb2.ProductInfoResponse(
-                exists=False,
-                error_message='Unauthorized'
-            )
-        
         product_id = request.product_id
         requesting_service = request.requesting_service
         
-        logger.info(f"gRPC GetProductInfo called by {requesting_service} for product_id={product_id}")
+        # Educational Note: %-style arguments are only formatted if the record
+        # is actually emitted, so nothing is built when INFO is disabled
+        # (an f-string is always built first). Per-request detail is DEBUG.
+        logger.info("gRPC GetProductInfo called by %s for product_id=%s", requesting_service, product_id)
         
         try:
-            product = Product.objects.get(id=product_id)
-            
-            # Educational Note: Convert Decimal to string to avoid precision issues
-            # Protocol Buffers don't have a native Decimal type
-            product_info = product_pb2.ProductInfo(
-                id=product.id,
-                name=product.name,
-                description=product.description,
-                price=str(product.price),  # Decimal → string
-                inventory_count=product.inventory_count,
-                is_available=product.is_available
-            )
+            product_info = _product_info_bytes([product_id]).get(product_id)
+            if product_info is None:
+                raise Product.DoesNotExist
             
-            logger.info(f"Product {product_id} info returned to {requesting_service}")
+            logger.debug("Product %s info returned to %s", product_id, requesting_service)
             
-            return product_pb2.ProductInfoResponse(
-                exists=True,
-                product_info=product_info
-            )
+            response = product_pb2.ProductInfoResponse(exists=True)
+            response.product_info.ParseFromString(product_info)
+            return response
             
         except Product.DoesNotExist:
             logger.warning(f"Product {product_id} not found (requested by {requesting_service})")
@@ -126,38 +333,33 @@ class ProductServiceServicer(product_pb2_grpc.ProductServiceServicer):
             AvailabilityResponse with availability status
         """
         
-        # Verify service authentication
-        metadata = dict(context.invocation_metadata())
-        auth_token = metadata.get('authorization', '')
-        
-        if auth_token != f'Bearer {SERVICE_SECRET}':
-            logger.warning(f"Unauthorized gRPC call from {request.requesting_service}")
-            context.set_code(grpc.StatusCode.UNAUTHENTICATED)
-            context.set_details('Invalid service credentials')
-            return product_pb2.AvailabilityResponse(
-                available=False,
-                available_quantity=0,
-                error_message='Unauthorized'
-            )
-        
         product_id = request.product_id
         quantity = request.quantity
         requesting_service = request.requesting_service
         
-        logger.info(f"gRPC CheckAvailability called by {requesting_service} for product_id={product_id}, quantity={quantity}")
+        logger.info("gRPC CheckAvailability called by %s for product_id=%s, quantity=%s", requesting_service, product_id, quantity)
         
         try:
-            product = Product.objects.get(id=product_id)
+            # Educational Note: Only the one column this needs, as a plain
+            # value - no other columns read, no model instance built
+            inventory_count = (
+                Product.objects.filter(id=product_id)
+                .values_list('inventory_count', flat=True)
+                .first()
+            )
+            if inventory_count is None:
+                raise Product.DoesNotExist
             
-            # Check if sufficient inventory exists
-            available = product.check_availability(quantity)
+            # Check if sufficient inventory exists (same rule as
+            # Product.check_availability)
+            available = inventory_count >= quantity
             
-            logger.info(f"Product {product_id} availability check: requested={quantity}, available={product.inventory_count}, result={available}")
+            logger.debug("Product %s availability check: requested=%s, available=%s, result=%s", product_id, quantity, inventory_count, available)
             
             return product_pb2.AvailabilityResponse(
                 available=available,
-                available_quantity=product.inventory_count,
-                error_message='' if available else f'Insufficient inventory. Available: {product.inventory_count}, Requested: {quantity}'
+                available_quantity=inventory_count,
+                error_message='' if available else f'Insufficient inventory. Available: {inventory_count}, Requested: {quantity}'
             )
             
         except Product.DoesNotExist:
@@ -179,35 +381,239 @@ class ProductServiceServicer(product_pb2_grpc.ProductServiceServicer):
                 available_quantity=0,
                 error_message='Internal server error'
             )
+    
+    def ReserveInventory(self, request, context):
+        """
+        Check and decrement inventory for every item of an order at once.
+        
+        Educational Note: Checking availability and creating the order in
+        separate steps leaves a window in which another order can take the
+        same stock (time-of-check to time-of-use). Here every product is
+        decremented with a conditional UPDATE (Product.reserve_inventory),
+        so the database checks and takes the stock in one statement and two
+        reservations can't both get the last units. It is all-or-nothing:
+        the UPDATEs run in one transaction, which is rolled back if any
+        product is short. OrderService calls ReleaseInventory if it then
+        fails to create the order (a compensating action, as in the saga
+        pattern).
+        
+        Args:
+            request: ReserveInventoryRequest with (product_id, quantity) items
+            context: gRPC context
+        
+        Returns:
+            ReserveInventoryResponse with ok and one result per item, in order
+        """
+        
+        requesting_service = request.requesting_service
+        
+        logger.info("gRPC ReserveInventory called by %s for %s items", requesting_service, len(request.items))
+        
+        try:
+            # Total quantity per product (a product may appear in more
+            # than one item)
+            requested = {}
+            for item in request.items:
+                requested[item.product_id] = requested.get(item.product_id, 0) + item.quantity
+            
+            # Educational Note: This read only fills in prices and the
+            # per-item results; it takes no locks and runs outside the
+            # transaction. The UPDATEs below re-check the stock themselves.
+            # (On SQLite a transaction that reads and then writes can fail
+            # with "database is locked" instead of waiting for the lock.)
+            products = Product.objects.only('id', 'price', 'inventory_count').in_bulk(list(requested))
+            
+            # Quantity requested so far per product, for the per-item results
+            so_far = {}
+            results = []
+            for item in request.items:
+                product = products.get(item.product_id)
+                if product is None:
+                    results.append(product_pb2.ReservationResult(
+                        product_id=item.product_id,
+                        exists=False,
+                        error_message=f'Product with id {item.product_id} not found'
+                    ))
+                    continue
+                
+                so_far[product.id] = so_far.get(product.id, 0) + item.quantity
+                reserved = item.quantity > 0 and product.check_availability(so_far[product.id])
+                results.append(product_pb2.ReservationResult(
+                    product_id=product.id,
+                    exists=True,
+                    reserved=reserved,
+                    price=str(product.price),  # Decimal → string
+                    price_cents=int(product.price.scaleb(2)),  # Exact: price has 2 decimal places
+                    available_quantity=product.inventory_count,
+                    error_message='' if reserved else f'Insufficient inventory. Available: {product.inventory_count}, Requested: {so_far[product.id]}'
+                ))
+            
+            ok = all(result.reserved for result in results)
+            if ok:
+                short_product_id = None
+                with transaction.atomic():
+                    # In id order, so concurrent reservations lock rows in
+                    # the same order and can't deadlock
+                    for product_id in sorted(requested):
+                        try:
+                            products[product_id].reserve_inventory(requested[product_id])
+                        except ValueError:
+                            short_product_id = product_id
+                            transaction.set_rollback(True)
+                            break
+                
+                if short_product_id is not None:
+                    # Another order took the stock after it was read above
+                    ok = False
+                    available = Product.objects.filter(id=short_product_id).values_list(
+                        'inventory_count', flat=True
+                    ).first() or 0
+                    for result in results:
+                        if result.product_id == short_product_id:
+                            result.reserved = False
+                            result.available_quantity = available
+                            result.error_message = f'Insufficient inventory. Available: {available}, Requested: {requested[short_product_id]}'
+            
+            # update() sends no post_save signals
+            if ok:
+                _evict_products(requested)
+                invalidate_product_list()
+            
+            logger.info("Inventory reservation for %s: ok=%s", requesting_service, ok)
+            
+            return product_pb2.ReserveInventoryResponse(ok=ok, results=results)
+            
+        except Exception as e:
+            logger.error(f"Error reserving inventory for {len(request.items)} items: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details('Internal server error')
+            
+            return product_pb2.ReserveInventoryResponse(ok=False)
+    
+    def ReleaseInventory(self, request, context):
+        """
+        Return inventory taken by a successful ReserveInventory call.
+        
+        Educational Note: The increments use F() expressions, so the database
+        adds to whatever the current count is; no read-modify-write race.
+        
+        Args:
+            request: ReleaseInventoryRequest with (product_id, quantity) items
+            context: gRPC context
+        
+        Returns:
+            ReleaseInventoryResponse
+        """
+        
+        requesting_service = request.requesting_service
+        
+        logger.info("gRPC ReleaseInventory called by %s for %s items", requesting_service, len(request.items))
+        
+        try:
+            released = {}
+            for item in request.items:
+                released[item.product_id] = released.get(item.product_id, 0) + item.quantity
+            
+            now = timezone.now()
+            with transaction.atomic():
+                for product_id, quantity in released.items():
+                    Product.objects.filter(id=product_id).update(
+                        inventory_count=F('inventory_count') + quantity,
+                        updated_at=now
+                    )
+            
+            # update() sends no post_save signals
+            _evict_products(released)
+            invalidate_product_list()
+            
+            return product_pb2.ReleaseInventoryResponse(ok=True)
+            
+        except Exception as e:
+            logger.error(f"Error releasing inventory for {len(request.items)} items: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details('Internal server error')
+            
+            return product_pb2.ReleaseInventoryResponse(ok=False)
 
 
-def serve():
+def _warm_up():
     """
-    Start the gRPC server.
+    Do the one-time setup work before the first real RPC arrives.
     
-    Educational Note: This server runs alongside Django HTTP server.
-    - HTTP: For frontend communication (port 8000)
-    - gRPC: For inter-service communication (port 50052)
+    Educational Note: The first ORM query compiles SQL and loads database
+    backend code lazily, and the first message of each type initializes
+    its protobuf class. Doing it here keeps that cost off the first
+    caller's latency.
     """
+    try:
+        Product.objects.only('id').first()
+    except Exception as e:
+        logger.warning(f"⚠️  Warm-up query failed: {e}")
+    finally:
+        # Worker threads open their own connections
+        connection.close()
     
-    port = os.getenv('GRPC_PORT', '50052')
-    
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    for message_class in (product_pb2.ProductInfoResponse, product_pb2.ReserveInventoryResponse):
+        message_class().SerializeToString()
+
+
+def _serve_worker(bind_address):
+    """Run one gRPC server until it is interrupted."""
+    server = grpc.server(
+        futures.ThreadPoolExecutor(
+            max_workers=GRPC_MAX_WORKERS,
+            thread_name_prefix='grpc-product',
+        ),
+        interceptors=[AuthInterceptor(), DatabaseConnectionInterceptor()],
+        options=GRPC_SERVER_OPTIONS,
+        maximum_concurrent_rpcs=GRPC_MAX_CONCURRENT_RPCS,
+    )
     
     # Register our service implementation
     product_pb2_grpc.add_ProductServiceServicer_to_server(
         ProductServiceServicer(), server
     )
     
-    # Bind to port
-    server.add_insecure_port(f'[::]:{port}')
+    # Bind to port (shared with the other processes via SO_REUSEPORT)
+    server.add_insecure_port(bind_address)
     
     # Start server
     server.start()
+    _warm_up()
     
-    logger.info(f"✓ gRPC server started on port {port}")
+    # Educational Note: Docker and Kubernetes stop containers with SIGTERM.
+    # Stopping the server makes wait_for_termination() return, so the
+    # process exits right away instead of waiting to be killed.
+    signal.signal(signal.SIGTERM, lambda *_: server.stop(grace=SHUTDOWN_GRACE))
+    
+    try:
+        server.wait_for_termination()
+    except KeyboardInterrupt:
+        server.stop(grace=SHUTDOWN_GRACE).wait()
+
+
+def serve():
+    """
+    Start the gRPC server.
+    
+    Educational Note: This server runs alongside Django HTTP server.
+    - HTTP: For frontend communication (port 8000)
+    - gRPC: For inter-service communication (port 50052)
+    
+    With GRPC_PROCESSES > 1 this follows gRPC's multiprocessing example:
+    one server per process, all bound to the same port. The processes are
+    spawned rather than forked, so they don't inherit this process's
+    threads or the locks they hold.
+    """
+    
+    port = os.getenv('GRPC_PORT', '50052')
+    bind_address = f'[::]:{port}'
+    
+    logger.info(f"✓ gRPC server starting on port {port}")
     logger.info(f"  Service: ProductService")
-    logger.info(f"  Methods: GetProductInfo, CheckAvailability")
+    logger.info(f"  Processes: {GRPC_PROCESSES}")
+    logger.info(f"  Workers: {GRPC_MAX_WORKERS} per process (max concurrent RPCs: {GRPC_MAX_CONCURRENT_RPCS})")
+    logger.info(f"  Methods: GetProductInfo, CheckAvailability, ReserveInventory, ReleaseInventory")
     logger.info(f"  Protocol: gRPC (HTTP/2 + Protocol Buffers)")
     logger.info(f"")
     logger.info(f"Educational Note:")
@@ -216,13 +622,34 @@ def serve():
     logger.info(f"  - 7-10x faster than REST (binary vs JSON)")
     logger.info(f"  - Type-safe (Protocol Buffers)")
     
+    if GRPC_PROCESSES <= 1:
+        _serve_worker(bind_address)
+        logger.info("Shutting down gRPC server...")
+        return
+    
+    context = multiprocessing.get_context('spawn')
+    workers = [
+        context.Process(target=_serve_worker, args=(bind_address,))
+        for _ in range(GRPC_PROCESSES)
+    ]
+    for worker in workers:
+        worker.start()
+    
+    # Pass SIGTERM on to the workers, which stop their servers
+    def _terminate_workers(*_):
+        for worker in workers:
+            worker.terminate()
+    
+    signal.signal(signal.SIGTERM, _terminate_workers)
+    
     try:
-        # Keep server running
-        while True:
-            time.sleep(86400)
+        for worker in workers:
+            worker.join()
     except KeyboardInterrupt:
+        # The workers get the same Ctrl+C and stop themselves
         logger.info("Shutting down gRPC server...")
-        server.stop(0)
+        for worker in workers:
+            worker.join()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,23 @@
+"""
+HTTP middleware for ProductService.
+"""
+
+from django.middleware.gzip import GZipMiddleware
+
+
+class MinimumSizeGZipMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware that leaves small responses uncompressed.
+    
+    Educational Note: JSON compresses very well (field names repeat in
+    every object), so gzip typically cuts list responses by 70-90%. For
+    tiny bodies like health checks the gzip header and CPU time cost more
+    than they save; Django's own cut-off is only 200 bytes.
+    """
+    
+    min_length = 1024  # bytes
+    
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < self.min_length:
+            return response
+        return super().process_response(request, response)
@@ -11,9 +11,10 @@ Key Difference from UserService:
 """
 
 import os
-import requests
 from pathlib import Path
+from urllib.parse import unquote, urlparse
 from datetime import timedelta
+from cryptography.hazmat.primitives import serialization
 
 # Build paths inside the project
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -45,8 +46,15 @@ INSTALLED_APPS = [
     'products',
 ]
 
+# Educational Note: The API authenticates with JWT only (see
+# DEFAULT_AUTHENTICATION_CLASSES below), so API requests never read the
+# session: SessionMiddleware and AuthenticationMiddleware only load the
+# session/user when something asks for them, and DRF views are CSRF-exempt.
+# The session, auth, CSRF and message middleware stay for the Django admin,
+# which needs all four.
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'product_service.middleware.MinimumSizeGZipMiddleware',  # Compress responses >= 1 KB
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -78,12 +86,36 @@ WSGI_APPLICATION = 'product_service.wsgi.application'
 
 # Database
 # Educational Note: Each service has its own database (service isolation)
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'data' / 'db.sqlite3',
+# SQLite is used in development. When DATABASE_URL points at PostgreSQL (as in
+# docker-compose.prod.yml), use it instead: Postgres doesn't serialize writers
+# the way SQLite does. Django 4.2 has no built-in connection pool, so
+# CONN_MAX_AGE keeps each worker's connection open across requests instead.
+DATABASE_URL = os.getenv('DATABASE_URL', '')
+
+if DATABASE_URL.startswith(('postgres://', 'postgresql://')):
+    _database_url = urlparse(DATABASE_URL)
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': _database_url.path.lstrip('/'),
+            'USER': unquote(_database_url.username or ''),
+            'PASSWORD': unquote(_database_url.password or ''),
+            'HOST': _database_url.hostname or '',
+            'PORT': str(_database_url.port or ''),
+            'CONN_MAX_AGE': 60,  # Reuse connections for up to 60 seconds
+            'CONN_HEALTH_CHECKS': True,  # Drop dead connections before reuse
+        }
+    }
+else:
+    # WAL mode and the other PRAGMAs are applied per connection in
+    # products/apps.py (Django 4.2's SQLite backend has no init_command)
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'data' / 'db.sqlite3',
+            'CONN_MAX_AGE': 60,
+        }
     }
-}
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -119,9 +151,6 @@ CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
         'LOCATION': os.getenv('REDIS_URL', 'redis://redis:6379/2'),
-        'OPTIONS': {
-            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
-        },
         'KEY_PREFIX': 'product_service',
         'TIMEOUT': 300,  # Default timeout: 5 minutes
     }
@@ -136,9 +165,17 @@ CORS_ALLOW_CREDENTIALS = True
 # Educational Note: This is the KEY to our RSA JWT architecture!
 # ============================================================================
 
-def fetch_public_key_from_user_service():
+USER_SERVICE_URL = os.getenv('USER_SERVICE_URL', 'http://user-service:8000')
+JWT_PUBLIC_KEY_PATH = os.getenv('JWT_PUBLIC_KEY_PATH', str(BASE_DIR / 'keys' / 'jwt_public.pem'))
+
+# How often the background thread re-fetches the key (seconds), so a
+# rotated key in UserService is picked up without a restart
+JWT_PUBLIC_KEY_REFRESH_INTERVAL = int(os.getenv('JWT_PUBLIC_KEY_REFRESH_INTERVAL', '600'))
+
+
+def load_public_key_from_disk():
     """
-    Fetch RSA public key from UserService for JWT verification.
+    Load the RSA public key for JWT verification from the shared volume.
     
     Educational Note: This is called once on startup.
     ProductService can then verify JWT tokens LOCALLY without calling UserService!
@@ -149,80 +186,55 @@ def fetch_public_key_from_user_service():
     - Services work even if UserService is down
     - Industry standard (OAuth2/OpenID Connect pattern)
     
-    Strategy:
-    1. Try to read from shared volume (fastest)
-    2. Fetch from UserService HTTP endpoint with retry (fallback)
-    3. Return None if all attempts fail (degraded mode)
+    Startup only reads the local file, so it never waits on UserService.
+    Fetching from UserService (and refreshing the key periodically, like a
+    JWKS client) happens in a background thread started by wsgi.py/asgi.py;
+    see products/public_key.py. Returns None if there is no key yet
+    (degraded mode until the background fetch succeeds).
     """
-    import time
-    
-    user_service_url = os.getenv('USER_SERVICE_URL', 'http://user-service:8000')
-    public_key_path = os.getenv('JWT_PUBLIC_KEY_PATH', str(BASE_DIR / 'keys' / 'jwt_public.pem'))
-    
-    # Create keys directory
-    os.makedirs(os.path.dirname(public_key_path), exist_ok=True)
-    
-    # Strategy 1: Try to read from shared volume
-    if os.path.exists(public_key_path):
+    if os.path.exists(JWT_PUBLIC_KEY_PATH):
         try:
-            with open(public_key_path, 'rb') as f:
+            with open(JWT_PUBLIC_KEY_PATH, 'rb') as f:
                 public_key = f.read()
-            print(f'✅ JWT public key loaded from shared volume: {public_key_path}')
+            print(f'✅ JWT public key loaded from shared volume: {JWT_PUBLIC_KEY_PATH}')
             return public_key
         except Exception as e:
             print(f'⚠️  Failed to read public key from volume: {e}')
     
-    # Strategy 2: Fetch from UserService HTTP endpoint with retry
-    max_retries = 5
-    retry_delay = 2  # seconds
-    
-    for attempt in range(1, max_retries + 1):
-        try:
-            print(f'🔄 Fetching public key from UserService (attempt {attempt}/{max_retries})...')
-            response = requests.get(
-                f'{user_service_url}/api/users/public-key/',
-                timeout=5
-            )
-            response.raise_for_status()
-            
-            public_key = response.json()['public_key'].encode('utf-8')
-            
-            # Save to local file for future use
-            try:
-                with open(public_key_path, 'wb') as f:
-                    f.write(public_key)
-                print(f'✅ JWT public key fetched and saved to {public_key_path}')
-            except Exception as e:
-                print(f'⚠️  Could not save public key to file: {e}')
-            
-            print(f'  Algorithm: RS256')
-            print(f'  ProductService can now verify JWT tokens locally!')
-            
-            return public_key
-            
-        except requests.exceptions.RequestException as e:
-            print(f'❌ Attempt {attempt} failed: {e}')
-            if attempt < max_retries:
-                print(f'   Retrying in {retry_delay} seconds...')
-                time.sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
-            else:
-                print(f'❌ Failed to fetch public key after {max_retries} attempts')
-    
-    # Strategy 3: Return None and log warning
-    print('⚠️  WARNING: Could not load JWT public key!')
+    print('⚠️  WARNING: No JWT public key on disk yet!')
+    print('   It will be fetched from UserService in the background.')
     print('   Authentication will not work until key is available.')
-    print('   Service will start in degraded mode.')
     return None
 
-# Fetch public key on startup
-JWT_PUBLIC_KEY_PEM = fetch_public_key_from_user_service()
+
+
+def parse_public_key(public_key_pem):
+    """
+    Parse a PEM public key into a key object (None if missing or invalid).
+    
+    Educational Note: PyJWT accepts either PEM bytes or a key object. Given
+    PEM it parses the key again for every token it verifies; given the
+    object it uses it as-is. So the key is parsed once, here, and the
+    object is what simplejwt verifies with.
+    """
+    if not public_key_pem:
+        return None
+    try:
+        return serialization.load_pem_public_key(public_key_pem)
+    except ValueError as e:
+        print(f'⚠️  Invalid JWT public key: {e}')
+        return None
+
+# Load public key on startup
+JWT_PUBLIC_KEY_PEM = load_public_key_from_disk()
+JWT_PUBLIC_KEY = parse_public_key(JWT_PUBLIC_KEY_PEM)
 
 # ============================================================================
 # Django REST Framework Configuration
 # ============================================================================
 
 REST_FRAMEWORK = {
+    # JWT only: no SessionAuthentication, so no session lookup or CSRF check
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
@@ -250,7 +262,7 @@ SIMPLE_JWT = {
     # Educational Note: We only need VERIFYING_KEY (public key)
     # No SIGNING_KEY because ProductService doesn't sign tokens
     'ALGORITHM': 'RS256',
-    'VERIFYING_KEY': JWT_PUBLIC_KEY_PEM,  # Public key for verification
+    'VERIFYING_KEY': JWT_PUBLIC_KEY,  # Public key for verification (parsed once)
     # No SIGNING_KEY - this service only verifies, doesn't sign
     
     'AUTH_HEADER_TYPES': ('Bearer',),
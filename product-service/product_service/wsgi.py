@@ -9,3 +9,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'product_service.settings')
 
 application = get_wsgi_application()
+
+# Educational Note: Only processes that serve HTTP verify JWTs, so the key
+# refresher starts here instead of in every process that loads settings
+# (management commands, the gRPC server, runserver's autoreloader).
+from products.public_key import start_public_key_refresher  # noqa: E402
+
+start_public_key_refresher()
@@ -1,6 +1,37 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+# Educational Note: By default SQLite blocks readers while a write commits.
+# In WAL (write-ahead log) mode readers keep working during writes, which
+# matters with many gRPC worker threads sharing one database file.
+# synchronous=NORMAL is safe in WAL mode and skips an fsync per commit.
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',  # 256 MB
+)
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """Apply SQLITE_PRAGMAS to each new SQLite connection."""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
 
 
 class ProductsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'products'
+
+    def ready(self):
+        connection_created.connect(configure_sqlite)
+
+        from django.db.models.signals import post_delete, post_save
+        from .list_cache import _invalidate_on_change
+        from .models import Product
+        post_save.connect(_invalidate_on_change, sender=Product, dispatch_uid='product_list_cache_save')
+        post_delete.connect(_invalidate_on_change, sender=Product, dispatch_uid='product_list_cache_delete')
@@ -53,8 +53,10 @@ class ProductFactory(DjangoModelFactory):
     )
     
     # Random prices between $19.99 and $999.99
+    # Picking a whole number of cents and shifting the exponent builds the
+    # Decimal directly, without going through float rounding and str().
     price = factory.LazyFunction(
-        lambda: Decimal(str(round(random.uniform(19.99, 999.99), 2)))
+        lambda: Decimal(random.randrange(1999, 100000)).scaleb(-2)
     )
     
     # Random inventory between 0 and 100
@@ -81,7 +83,7 @@ class LaptopFactory(ProductFactory):
     
     # Laptops are more expensive
     price = factory.LazyFunction(
-        lambda: Decimal(str(round(random.uniform(999.99, 2999.99), 2)))
+        lambda: Decimal(random.randrange(99999, 300000)).scaleb(-2)
     )
     
     # Lower inventory for expensive items
@@ -107,7 +109,7 @@ class AccessoryFactory(ProductFactory):
     
     # Accessories are cheaper
     price = factory.LazyFunction(
-        lambda: Decimal(str(round(random.uniform(5.99, 49.99), 2)))
+        lambda: Decimal(random.randrange(599, 5000)).scaleb(-2)
     )
     
     # Higher inventory for cheap items
@@ -0,0 +1,52 @@
+"""
+Filter backends for ProductService.
+
+Educational Note: DRF's SearchFilter turns ?search= into
+name ILIKE '%term%' OR description ILIKE '%term%'. On PostgreSQL the
+product list searches the stored, GIN-indexed search_vector column
+instead, so a search is an index lookup rather than a pass over every
+row's text.
+"""
+
+import re
+
+from django.contrib.postgres.search import SearchQuery
+from django.db import connections
+from rest_framework import filters
+
+# Text search configuration used by the search_vector trigger (migration 0003)
+SEARCH_CONFIG = 'english'
+
+_WORD_RE = re.compile(r'\w+')
+
+
+class ProductSearchFilter(filters.SearchFilter):
+    """
+    Full-text ?search= on PostgreSQL, DRF's icontains search elsewhere.
+    
+    Educational Note: Every word of the search has to match, and each word
+    matches as a prefix (to_tsquery's 'lapt:*'), so results appear while
+    the user is still typing a word, as they did with icontains. Only \\w+
+    runs of the input reach the query, so search text can't inject
+    tsquery operators. Results keep the list's normal ordering, which the
+    cursor pagination depends on, so they are filtered rather than ranked.
+    """
+    
+    def filter_queryset(self, request, queryset, view):
+        if connections[queryset.db].vendor != 'postgresql':
+            return super().filter_queryset(request, queryset, view)
+        
+        words = [
+            word
+            for term in self.get_search_terms(request)
+            for word in _WORD_RE.findall(term)
+        ]
+        if not words:
+            return queryset
+        
+        query = SearchQuery(
+            ' & '.join(f'{word}:*' for word in words),
+            search_type='raw',
+            config=SEARCH_CONFIG,
+        )
+        return queryset.filter(search_vector=query)
@@ -0,0 +1,46 @@
+"""
+Response cache for the product list endpoint.
+
+Educational Note: GET /api/products/ is public and the same for every
+caller, so its rendered JSON is cached in Redis per URL (scheme, host and
+query string, since the pagination links include the host). Entries are
+never deleted one by one; instead every key includes a version number,
+and any product change bumps the version, so older entries are simply no
+longer looked up (and expire on their own).
+"""
+
+import logging
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_LIST_CACHE_TIMEOUT = 60  # seconds
+PRODUCT_LIST_VERSION_KEY = 'products:version'
+
+
+def product_list_version():
+    """Current product list version (started from the clock if unset)."""
+    return cache.get_or_set(PRODUCT_LIST_VERSION_KEY, lambda: int(time.time()), timeout=None)
+
+
+def invalidate_product_list():
+    """
+    Make every cached product list stale.
+    
+    Called whenever products change. Failures are only logged: the cached
+    lists expire after PRODUCT_LIST_CACHE_TIMEOUT anyway.
+    """
+    try:
+        cache.incr(PRODUCT_LIST_VERSION_KEY)
+    except ValueError:
+        # No version yet, so nothing has been cached under one
+        pass
+    except Exception as e:
+        logger.warning(f"⚠️  Could not invalidate cached product lists: {e}")
+
+
+def _invalidate_on_change(sender, **kwargs):
+    """post_save/post_delete receiver for Product."""
+    invalidate_product_list()
@@ -17,6 +17,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT statement in bulk_create
+BULK_BATCH_SIZE = 500
+
 
 class Command(BaseCommand):
     help = 'Seed the database with sample product data'
@@ -59,29 +62,32 @@ class Command(BaseCommand):
                     return
                 
                 # Create a mix of products
-                self.stdout.write('💻 Creating laptop products...')
-                laptops = LaptopFactory.create_batch(5)
-                self.stdout.write(
-                    self.style.SUCCESS(f'✅ Created {len(laptops)} laptops')
-                )
+                # Educational Note: Products are built in memory and inserted
+                # with one bulk_create (one statement per BULK_BATCH_SIZE
+                # rows) instead of one INSERT per product.
+                self.stdout.write('💻 Building laptop products...')
+                laptops = LaptopFactory.build_batch(5)
                 
-                self.stdout.write('🖱️  Creating accessory products...')
-                accessories = AccessoryFactory.create_batch(5)
-                self.stdout.write(
-                    self.style.SUCCESS(f'✅ Created {len(accessories)} accessories')
-                )
+                self.stdout.write('🖱️  Building accessory products...')
+                accessories = AccessoryFactory.build_batch(5)
                 
-                self.stdout.write('📦 Creating general products...')
+                self.stdout.write('📦 Building general products...')
                 remaining = num_products - 10 - 2  # Subtract laptops, accessories, and out-of-stock
-                if remaining > 0:
-                    products = ProductFactory.create_batch(remaining)
-                    self.stdout.write(
-                        self.style.SUCCESS(f'✅ Created {len(products)} general products')
-                    )
+                products = ProductFactory.build_batch(remaining) if remaining > 0 else []
                 
                 # Create a couple out-of-stock items for testing
-                self.stdout.write('❌ Creating out-of-stock products (for testing)...')
-                out_of_stock = OutOfStockProductFactory.create_batch(2)
+                self.stdout.write('❌ Building out-of-stock products (for testing)...')
+                out_of_stock = OutOfStockProductFactory.build_batch(2)
+                
+                Product.objects.bulk_create(
+                    laptops + accessories + products + out_of_stock,
+                    batch_size=BULK_BATCH_SIZE,
+                )
+                
+                self.stdout.write(self.style.SUCCESS(f'✅ Created {len(laptops)} laptops'))
+                self.stdout.write(self.style.SUCCESS(f'✅ Created {len(accessories)} accessories'))
+                if products:
+                    self.stdout.write(self.style.SUCCESS(f'✅ Created {len(products)} general products'))
                 self.stdout.write(
                     self.style.SUCCESS(f'✅ Created {len(out_of_stock)} out-of-stock products')
                 )
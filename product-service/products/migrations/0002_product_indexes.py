@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-15 18:23
+
+from django.db import migrations, models
+
+
+# Educational Note: ?search= is served by the search_vector GIN index
+# (migration 0003) on PostgreSQL, so no trigram indexes are needed for it.
+# This migration only adds the partial "in stock" index.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('inventory_count__gt', 0)), fields=['inventory_count'], name='prod_avail_idx'),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 4.2.7 on 2026-10-15 18:31
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Educational Note: On PostgreSQL, search_vector is filled in by a BEFORE
+# INSERT/UPDATE trigger, so every write path keeps it current - including
+# bulk_create(), QuerySet.update() and raw SQL, which skip model signals.
+# The GIN index makes @@ (full-text match) queries index lookups. Existing
+# rows are filled in once here. SQLite has no full-text types, so there the
+# column is only added (and stays NULL).
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce({row}name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce({row}description, '')), 'B')"
+)
+
+
+def create_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    
+    table = apps.get_model('products', 'Product')._meta.db_table
+    schema_editor.execute(f'''
+        CREATE OR REPLACE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_SQL.format(row='NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    ''')
+    schema_editor.execute(f'''
+        CREATE TRIGGER {table}_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF name, description ON {table}
+        FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update()
+    ''')
+    schema_editor.execute(
+        f'UPDATE {table} SET search_vector = {SEARCH_VECTOR_SQL.format(row="")}'
+    )
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS prod_search_vector_idx '
+        f'ON {table} USING gin (search_vector)'
+    )
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    
+    table = apps.get_model('products', 'Product')._meta.db_table
+    schema_editor.execute('DROP INDEX IF EXISTS prod_search_vector_idx')
+    schema_editor.execute(f'DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table}')
+    schema_editor.execute(f'DROP FUNCTION IF EXISTS {table}_search_vector_update()')
+
+
+# Educational Note: Earlier versions of migration 0002 built GIN trigram
+# indexes on name and description for icontains search. Search now uses
+# search_vector instead, and each of those indexes only slowed down every
+# write, so databases that still have them drop them here. The pg_trgm
+# extension is left installed, since other objects may depend on it.
+TRIGRAM_INDEXES = ('prod_name_trgm_idx', 'prod_desc_trgm_idx')
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    
+    for index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_product_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Full-text search document (maintained by the database)', null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+        migrations.RunPython(drop_trigram_indexes, migrations.RunPython.noop),
+    ]
@@ -5,8 +5,11 @@ Educational Note: This demonstrates service-specific data models.
 Each service owns its data and provides APIs for other services to access it.
 """
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import F
 from django.core.validators import MinValueValidator
+from django.utils import timezone
 from decimal import Decimal
 
 
@@ -52,11 +55,29 @@ class Product(models.Model):
         help_text="When the product was last updated"
     )
     
+    # Full-text search document: name (weight A) and description (weight B)
+    # Educational Note: On PostgreSQL a database trigger keeps this column
+    # up to date (see migration 0003), so bulk_create() and update() can't
+    # leave it stale the way a post_save signal would. On SQLite it stays
+    # NULL and search falls back to icontains (see filters.py).
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text search document (maintained by the database)"
+    )
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['name']),
             models.Index(fields=['created_at']),
+            # Partial index: only in-stock rows, for "is available" lookups
+            # (inventory_count > 0); smaller than indexing every product
+            models.Index(
+                fields=['inventory_count'],
+                name='prod_avail_idx',
+                condition=models.Q(inventory_count__gt=0),
+            ),
         ]
     
     def __str__(self):
@@ -99,8 +120,22 @@ class Product(models.Model):
         Raises:
             ValueError: If insufficient inventory
         """
-        if not self.check_availability(quantity):
-            raise ValueError(f"Insufficient inventory. Available: {self.inventory_count}, Requested: {quantity}")
+        # Educational Note: One conditional UPDATE checks and decrements in
+        # the database, so two concurrent reservations can't both read the
+        # same count and oversell (a read-modify-write save() could).
+        # update() skips auto_now, so updated_at is set explicitly.
+        updated = Product.objects.filter(
+            pk=self.pk, inventory_count__gte=quantity
+        ).update(
+            inventory_count=F('inventory_count') - quantity,
+            updated_at=timezone.now(),
+        )
+        
+        if not updated:
+            # Nothing changed, so the loaded values are still what they were
+            raise ValueError(f"Insufficient inventory for product {self.pk}. Requested: {quantity}")
         
-        self.inventory_count -= quantity
-        self.save()
+        # The values on this instance are now stale; dropping them makes
+        # them deferred, so they're reloaded only if something reads them
+        self.__dict__.pop('inventory_count', None)
+        self.__dict__.pop('updated_at', None)
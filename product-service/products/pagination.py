@@ -0,0 +1,30 @@
+"""
+Pagination classes for ProductService.
+
+Educational Note: Page-number pagination runs COUNT(*) over the whole
+table and then SELECT ... OFFSET N, which reads and throws away N rows, so
+deep pages get slower as the catalog grows. Cursor pagination remembers
+where the previous page ended instead:
+
+    WHERE created_at < :cursor ORDER BY created_at DESC LIMIT 50
+
+That is a range scan on the created_at index, the same cost for page 1 or
+page 1000. The trade-off: there are no page numbers or total count, only
+next/previous links.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Newest-first cursor pagination over the indexed created_at column.
+
+    Clients may ask for a different page size with ?page_size=, capped at
+    max_page_size so one request can't pull the whole catalog.
+    """
+
+    ordering = '-created_at'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
@@ -0,0 +1,147 @@
+"""
+Background fetch and refresh of the JWT public key.
+
+Educational Note: settings.py only reads the key from disk, so startup never
+waits on UserService. This thread fetches the key from UserService, saves
+it for the next start, and re-fetches it every
+JWT_PUBLIC_KEY_REFRESH_INTERVAL seconds so a rotated key is picked up
+without a restart (the same idea as a JWKS client).
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Short timeouts: a slow UserService delays the refresh, never a request.
+# (connect, read) in seconds.
+FETCH_TIMEOUT = (1, 2)
+
+# Educational Note: A shared Session keeps the connection to UserService
+# alive between attempts and refreshes, and urllib3's Retry does the
+# backoff between attempts (0.5s, 1s, 2s, ...) instead of a
+# hand-written loop.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.25,
+        status_forcelist=(502, 503, 504),
+    ),
+)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+# Retry interval while there is no key at all (degraded mode)
+MISSING_KEY_RETRY_INTERVAL = 5  # seconds
+
+_refresher_started = False
+_refresher_lock = threading.Lock()
+
+
+def fetch_public_key():
+    """Fetch the public key from UserService; returns None if it can't."""
+    try:
+        response = _session.get(
+            f'{settings.USER_SERVICE_URL}/api/users/public-key/',
+            timeout=FETCH_TIMEOUT
+        )
+        response.raise_for_status()
+        return response.json()['public_key'].encode('utf-8')
+    except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+        logger.warning("❌ Failed to fetch public key after retries: %s", e)
+        return None
+
+
+def save_public_key(public_key):
+    """
+    Write the key to JWT_PUBLIC_KEY_PATH atomically.
+    
+    Educational Note: The key is written to a temporary file in the same
+    directory and then os.replace()d over the old one, so another process
+    starting up never reads a half-written key.
+    """
+    directory = os.path.dirname(settings.JWT_PUBLIC_KEY_PATH)
+    os.makedirs(directory, exist_ok=True)
+    
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.jwt_public.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(public_key)
+        os.replace(tmp_path, settings.JWT_PUBLIC_KEY_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def refresh_public_key():
+    """
+    Fetch the key once and start using it if it changed.
+    
+    Returns True if a key is available afterwards.
+    """
+    public_key = fetch_public_key()
+    if public_key is None:
+        return settings.JWT_PUBLIC_KEY_PEM is not None
+    
+    if public_key != settings.JWT_PUBLIC_KEY_PEM:
+        from product_service.settings import parse_public_key
+        
+        verifying_key = parse_public_key(public_key)
+        if verifying_key is None:
+            return settings.JWT_PUBLIC_KEY_PEM is not None
+        
+        # Educational Note: simplejwt builds one TokenBackend from SIMPLE_JWT
+        # at import time and verifies every token with it, so the new key
+        # has to be set there as well as in settings. It gets the parsed
+        # key object, like SIMPLE_JWT['VERIFYING_KEY'].
+        from rest_framework_simplejwt.state import token_backend
+        
+        settings.JWT_PUBLIC_KEY_PEM = public_key
+        settings.JWT_PUBLIC_KEY = verifying_key
+        token_backend.verifying_key = verifying_key
+        logger.info("✅ JWT public key fetched from UserService")
+        
+        try:
+            save_public_key(public_key)
+        except OSError as e:
+            logger.warning("⚠️  Could not save public key to file: %s", e)
+    
+    return True
+
+
+def _refresh_forever():
+    while True:
+        try:
+            has_key = refresh_public_key()
+        except Exception:
+            logger.exception("❌ Public key refresh failed")
+            has_key = settings.JWT_PUBLIC_KEY_PEM is not None
+        
+        time.sleep(settings.JWT_PUBLIC_KEY_REFRESH_INTERVAL if has_key else MISSING_KEY_RETRY_INTERVAL)
+
+
+def start_public_key_refresher():
+    """Start the refresh thread (once per process)."""
+    global _refresher_started
+    
+    with _refresher_lock:
+        if _refresher_started:
+            return
+        _refresher_started = True
+    
+    threading.Thread(
+        target=_refresh_forever,
+        name='jwt-public-key-refresher',
+        daemon=True,
+    ).start()
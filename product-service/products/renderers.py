@@ -0,0 +1,40 @@
+"""
+DRF renderers for ProductService.
+
+Educational Note: DRF's JSONRenderer encodes with the standard library json
+module. orjson does the same work in compiled code, which matters most for
+the product list, the largest and most requested response.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Compact UTF-8 output, like DRF's JSONRenderer with its default settings.
+# Dates and times go through DRF's encoder so they are formatted exactly as
+# before ('Z' for UTC).
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# Fallback for types orjson doesn't handle natively (Decimal, lazy
+# translation strings, ...), identical to DRF's
+_drf_default = JSONEncoder().default
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson.
+
+    Subclassing JSONRenderer keeps its media type, format ('json', which the
+    product list cache keys on) and ?indent handling; only the encoder
+    changes. orjson only supports 2-space indentation.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        option = ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=_drf_default, option=option)
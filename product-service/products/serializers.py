@@ -5,11 +5,34 @@ Educational Note: DRF ModelSerializer automatically creates fields
 based on the model, reducing boilerplate significantly.
 """
 
+from copy import copy
+
 from rest_framework import serializers
 from .models import Product
 
+# Fields built by CachedFieldsModelSerializer.get_fields(), by serializer class
+_FIELDS_CACHE = {}
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its fields once per class.
+    
+    Educational Note: ModelSerializer.get_fields() introspects the model
+    and builds every Field from scratch each time a serializer is created.
+    The result only depends on the serializer class, so we keep the first
+    result and hand each instance shallow copies (binding sets attributes
+    like parent and source on the field, so instances must not share one).
+    """
+    
+    def get_fields(self):
+        cls = self.__class__
+        if cls not in _FIELDS_CACHE:
+            _FIELDS_CACHE[cls] = super().get_fields()
+        return {name: copy(field) for name, field in _FIELDS_CACHE[cls].items()}
+
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(CachedFieldsModelSerializer):
     """
     Serializer for Product model.
     
@@ -66,7 +89,7 @@ class ProductSerializer(serializers.ModelSerializer):
         return value
 
 
-class ProductListSerializer(serializers.ModelSerializer):
+class ProductListSerializer(CachedFieldsModelSerializer):
     """
     Lightweight serializer for product listings.
     
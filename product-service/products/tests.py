@@ -1,9 +1,210 @@
 """
 Tests for ProductService.
 
-Educational Note: Tests will be added in later tasks.
+Educational Note: The gRPC servicer methods are plain Python methods, so
+they are called directly here with a mock context; no server is started.
 """
 
-from django.test import TestCase
+from decimal import Decimal
+from unittest import mock
 
-# Tests will be added in later tasks
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from grpc_generated import product_pb2
+from grpc_server import ProductServiceServicer
+from products.models import Product
+from products.serializers import ProductSerializer
+
+# Tests must not depend on a running Redis
+LOCMEM_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+}
+
+
+def _items(*pairs):
+    """ProductQuantity messages for (product_id, quantity) pairs."""
+    return [
+        product_pb2.ProductQuantity(product_id=product_id, quantity=quantity)
+        for product_id, quantity in pairs
+    ]
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ReserveInventoryTests(TestCase):
+    """ReserveInventory takes stock for every item of an order, or none."""
+
+    def setUp(self):
+        self.servicer = ProductServiceServicer()
+        self.laptop = Product.objects.create(name='Laptop', price=Decimal('999.99'), inventory_count=5)
+        self.mouse = Product.objects.create(name='Mouse', price=Decimal('19.50'), inventory_count=1)
+
+    def reserve(self, *pairs):
+        request = product_pb2.ReserveInventoryRequest(items=_items(*pairs), requesting_service='tests')
+        return self.servicer.ReserveInventory(request, mock.Mock())
+
+    def assertInventory(self, product, expected):
+        product.refresh_from_db(fields=['inventory_count'])
+        self.assertEqual(product.inventory_count, expected)
+
+    def test_reserves_every_item(self):
+        response = self.reserve((self.laptop.id, 2), (self.mouse.id, 1))
+
+        self.assertTrue(response.ok)
+        self.assertEqual([r.product_id for r in response.results], [self.laptop.id, self.mouse.id])
+        self.assertTrue(all(r.reserved for r in response.results))
+        self.assertEqual(response.results[0].price, '999.99')
+        self.assertEqual(response.results[0].price_cents, 99999)
+        self.assertInventory(self.laptop, 3)
+        self.assertInventory(self.mouse, 0)
+
+    def test_one_short_item_reserves_nothing(self):
+        response = self.reserve((self.laptop.id, 2), (self.mouse.id, 2))
+
+        self.assertFalse(response.ok)
+        self.assertTrue(response.results[0].reserved)
+        self.assertFalse(response.results[1].reserved)
+        self.assertEqual(response.results[1].available_quantity, 1)
+        self.assertInventory(self.laptop, 5)
+        self.assertInventory(self.mouse, 1)
+
+    def test_missing_product_reserves_nothing(self):
+        response = self.reserve((self.laptop.id, 1), (999999, 1))
+
+        self.assertFalse(response.ok)
+        self.assertFalse(response.results[1].exists)
+        self.assertInventory(self.laptop, 5)
+
+    def test_product_in_two_items_counts_both_quantities(self):
+        # 3 + 3 > 5: each item fits on its own, together they don't
+        response = self.reserve((self.laptop.id, 3), (self.laptop.id, 3))
+
+        self.assertFalse(response.ok)
+        self.assertInventory(self.laptop, 5)
+
+        response = self.reserve((self.laptop.id, 2), (self.laptop.id, 3))
+
+        self.assertTrue(response.ok)
+        self.assertEqual(len(response.results), 2)
+        self.assertInventory(self.laptop, 0)
+
+    def test_stock_taken_after_the_read_reserves_nothing(self):
+        # The read says there is enough (as if another order took the stock
+        # right after it); the conditional UPDATE must still refuse
+        with mock.patch.object(Product, 'check_availability', return_value=True):
+            response = self.reserve((self.laptop.id, 2), (self.mouse.id, 3))
+
+        self.assertFalse(response.ok)
+        self.assertFalse(response.results[1].reserved)
+        self.assertEqual(response.results[1].available_quantity, 1)
+        self.assertInventory(self.laptop, 5)
+        self.assertInventory(self.mouse, 1)
+
+    def test_zero_quantity_is_not_reserved(self):
+        response = self.reserve((self.laptop.id, 0))
+
+        self.assertFalse(response.ok)
+        self.assertInventory(self.laptop, 5)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ReleaseInventoryTests(TestCase):
+    """ReleaseInventory gives back what ReserveInventory took."""
+
+    def setUp(self):
+        self.servicer = ProductServiceServicer()
+        self.laptop = Product.objects.create(name='Laptop', price=Decimal('999.99'), inventory_count=5)
+
+    def test_release_undoes_reservation(self):
+        items = _items((self.laptop.id, 2), (self.laptop.id, 1))
+
+        reserved = self.servicer.ReserveInventory(
+            product_pb2.ReserveInventoryRequest(items=items, requesting_service='tests'), mock.Mock()
+        )
+        self.assertTrue(reserved.ok)
+        self.laptop.refresh_from_db(fields=['inventory_count'])
+        self.assertEqual(self.laptop.inventory_count, 2)
+
+        released = self.servicer.ReleaseInventory(
+            product_pb2.ReleaseInventoryRequest(items=items, requesting_service='tests'), mock.Mock()
+        )
+        self.assertTrue(released.ok)
+        self.laptop.refresh_from_db(fields=['inventory_count'])
+        self.assertEqual(self.laptop.inventory_count, 5)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ProductReserveInventoryTests(TestCase):
+    """Product.reserve_inventory() decrements with one conditional UPDATE."""
+
+    def setUp(self):
+        self.product = Product.objects.create(name='Laptop', price=Decimal('999.99'), inventory_count=5)
+
+    def test_decrements_inventory(self):
+        self.product.reserve_inventory(2)
+
+        self.assertEqual(self.product.inventory_count, 3)  # reloaded on access
+
+    def test_checks_current_count_not_loaded_one(self):
+        Product.objects.filter(pk=self.product.pk).update(inventory_count=1)
+
+        with self.assertRaises(ValueError):
+            self.product.reserve_inventory(2)
+
+        self.product.refresh_from_db(fields=['inventory_count'])
+        self.assertEqual(self.product.inventory_count, 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ProductListCacheTests(TestCase):
+    """The cached product list is revalidated with its ETag and kept per host."""
+
+    URL = '/api/products/?page_size=1'
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        for name in ('Laptop', 'Mouse'):
+            Product.objects.create(name=name, price=Decimal('10.00'), inventory_count=1)
+
+    def test_matching_etag_gets_304(self):
+        first = self.client.get(self.URL)
+        self.assertEqual(first.status_code, 200)
+
+        second = self.client.get(self.URL, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_clients_must_revalidate(self):
+        response = self.client.get(self.URL)
+
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+
+    def test_pagination_links_follow_the_request_host(self):
+        internal = self.client.get(self.URL, HTTP_HOST='product-service:8000')
+        public = self.client.get(self.URL, HTTP_HOST='shop.example.com')
+
+        self.assertTrue(internal.json()['next'].startswith('http://product-service:8000/'))
+        self.assertTrue(public.json()['next'].startswith('http://shop.example.com/'))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedFieldsModelSerializerTests(TestCase):
+    """Serializer instances get their own copies of the cached fields."""
+
+    def test_instances_do_not_share_bound_fields(self):
+        first = ProductSerializer()
+        second = ProductSerializer()
+
+        for name, field in first.fields.items():
+            self.assertIsNot(field, second.fields[name])
+            self.assertIs(field.parent, first)
+            self.assertIs(second.fields[name].parent, second)
+
+    def test_cached_fields_serialize_like_fresh_ones(self):
+        product = Product.objects.create(name='Laptop', price=Decimal('999.99'), inventory_count=5)
+
+        self.assertEqual(ProductSerializer(product).data, ProductSerializer(product).data)
+        self.assertEqual(ProductSerializer(product).data['price'], '999.99')
@@ -5,21 +5,33 @@ Educational Note: This service VERIFIES JWT tokens using the public key.
 No need to call UserService for authentication! (50% latency reduction)
 """
 
+import hashlib
+import json
 import logging
+
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse
+from django.utils.http import parse_etags
+from django.views.decorators.http import require_safe
 from rest_framework import viewsets, status, filters
-from rest_framework.decorators import api_view, permission_classes, action
+from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from .filters import ProductSearchFilter
+from .list_cache import PRODUCT_LIST_CACHE_TIMEOUT, product_list_version
 from .models import Product
+from .pagination import CreatedAtCursorPagination
+from .renderers import ORJSONRenderer
 from .serializers import ProductSerializer, ProductListSerializer
 
 logger = logging.getLogger(__name__)
 
 
 @extend_schema_view(
-    list=extend_schema(description="List all products with pagination and search"),
+    list=extend_schema(description="List all products with cursor pagination and search"),
     retrieve=extend_schema(description="Get product details"),
     create=extend_schema(description="Create a new product (admin only)"),
     update=extend_schema(description="Update a product (admin only)"),
@@ -49,11 +61,34 @@ class ProductViewSet(viewsets.ModelViewSet):
     queryset = Product.objects.all()
     serializer_class = ProductSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    pagination_class = CreatedAtCursorPagination
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    filter_backends = [ProductSearchFilter, filters.OrderingFilter]
     search_fields = ['name', 'description']
     ordering_fields = ['name', 'price', 'created_at']
     ordering = ['-created_at']
     
+    # Columns ProductListSerializer reads, plus created_at for the cursor
+    LIST_FIELDS = ('id', 'name', 'price', 'inventory_count', 'created_at')
+    
+    def get_queryset(self):
+        """
+        Load only the columns the list view needs.
+        
+        Educational Note: description is a TextField and usually the widest
+        column, but the list serializer never shows it. .only() leaves it
+        (and updated_at) out of the SELECT. Everything the serializer reads,
+        including inventory_count for is_available, is still loaded, so no
+        deferred field is fetched later. Search and ordering happen in SQL,
+        so they are unaffected.
+        """
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            return queryset.only(*self.LIST_FIELDS)
+        # search_vector is only read by the database (search); no
+        # serializer shows it
+        return queryset.defer('search_vector')
+    
     def get_serializer_class(self):
         """
         Use different serializers for list vs detail views.
@@ -85,7 +120,65 @@ class ProductViewSet(viewsets.ModelViewSet):
         via DRF authentication classes. No manual token checking needed!
         """
         logger.info(f"Product list requested (authenticated: {request.user.is_authenticated})")
-        return super().list(request, *args, **kwargs)
+        
+        # Educational Note: The list is the same for every caller, so its
+        # rendered JSON is cached per URL (see list_cache.py). The
+        # ETag lets clients revalidate: if theirs still matches they get a
+        # 304 with no body, and nothing is queried, serialized or encoded.
+        # Only JSON is cached; the browsable API page is built as usual.
+        if request.accepted_renderer.format != 'json':
+            return super().list(request, *args, **kwargs)
+        
+        try:
+            # The absolute URL, not just the path: the pagination links in
+            # the body are built from the scheme and Host of the request,
+            # so a body cached for one host must not be served to another
+            url_hash = hashlib.md5(
+                f'{request.accepted_media_type}|{request.build_absolute_uri()}'.encode()
+            ).hexdigest()
+            cache_key = f'product_list:{product_list_version()}:{url_hash}'
+            cached = cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"⚠️  Product list cache unavailable: {e}")
+            cache_key, cached = None, None
+        
+        if cached is None:
+            response = super().list(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            
+            # Render now (DRF would do it after the view returns) so the
+            # bytes can be cached and hashed
+            response.accepted_renderer = request.accepted_renderer
+            response.accepted_media_type = request.accepted_media_type
+            response.renderer_context = self.get_renderer_context()
+            response.render()
+            etag = f'"{hashlib.md5(response.content).hexdigest()}"'
+            cached = (etag, response.content, response['Content-Type'])
+            
+            if cache_key is not None:
+                try:
+                    cache.set(cache_key, cached, PRODUCT_LIST_CACHE_TIMEOUT)
+                except Exception as e:
+                    logger.warning(f"⚠️  Could not cache product list: {e}")
+        
+        etag, content, content_type = cached
+        # Weak comparison: GZipMiddleware sends the ETag back as W/"..."
+        client_etags = {
+            tag.removeprefix('W/')
+            for tag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+        }
+        if etag in client_etags:
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type=content_type)
+        
+        response['ETag'] = etag
+        # no-cache: clients and proxies may keep the body but must revalidate
+        # it on every request, so stock changes show up at once (the Redis
+        # copy above is bumped when products change; theirs can't be)
+        response['Cache-Control'] = 'no-cache'
+        return response
     
     def create(self, request, *args, **kwargs):
         """
@@ -141,8 +234,16 @@ class ProductViewSet(viewsets.ModelViewSet):
         })
 
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
+# Body of a fully healthy response, encoded once. Probes hit the health
+# check every few seconds and almost always get this exact answer.
+HEALTHY_BODY = json.dumps({
+    'status': 'healthy',
+    'service': 'product-service',
+    'checks': {'jwt_public_key': 'ok', 'database': 'ok'},
+}, separators=(',', ':')).encode()
+
+
+@require_safe
 def health_check(request):
     """
     Health check endpoint for container orchestration.
@@ -150,10 +251,28 @@ def health_check(request):
     
     Educational Note: Docker uses this to determine if the service is ready.
     We check database connectivity and JWT public key availability.
+    
+    This is a plain Django view, not a DRF one: there is nothing to
+    authenticate, negotiate or validate, so DRF's Request, content
+    negotiation and renderer would be pure overhead on every probe. When
+    both checks pass, the pre-encoded HEALTHY_BODY is returned; the dict is
+    only built for a degraded or unhealthy answer.
     """
     from django.conf import settings
     from django.db import connection
     
+    key_ok = bool(getattr(settings, 'JWT_PUBLIC_KEY_PEM', None))
+    
+    # Check database connectivity
+    try:
+        connection.ensure_connection()
+        db_error = None
+    except Exception as e:
+        db_error = e
+    
+    if key_ok and db_error is None:
+        return HttpResponse(HEALTHY_BODY, content_type='application/json')
+    
     health_status = {
         'status': 'healthy',
         'service': 'product-service',
@@ -161,19 +280,17 @@ def health_check(request):
     }
     
     # Check if JWT public key is loaded
-    if hasattr(settings, 'JWT_PUBLIC_KEY_PEM') and settings.JWT_PUBLIC_KEY_PEM:
+    if key_ok:
         health_status['checks']['jwt_public_key'] = 'ok'
     else:
         health_status['checks']['jwt_public_key'] = 'missing'
         health_status['status'] = 'degraded'  # Can still start, but auth won't work
     
-    # Check database connectivity
-    try:
-        connection.ensure_connection()
+    if db_error is None:
         health_status['checks']['database'] = 'ok'
-    except Exception as e:
-        health_status['checks']['database'] = f'error: {str(e)}'
+    else:
+        health_status['checks']['database'] = f'error: {str(db_error)}'
         health_status['status'] = 'unhealthy'
     
     status_code = 200 if health_status['status'] in ['healthy', 'degraded'] else 503
-    return Response(health_status, status=status_code)
+    return JsonResponse(health_status, status=status_code)
@@ -5,6 +5,8 @@ Run with: docker-compose exec user-service python debug_2fa.py
 """
 import os
 import django
+import hashlib
+import hmac
 import time
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'user_service.settings')
@@ -12,7 +14,30 @@ django.setup()
 
 from django.contrib.auth.models import User
 from django_otp.plugins.otp_totp.models import TOTPDevice
-from django_otp.oath import totp
+
+
+def totp_codes(device, now, drift_offsets):
+    """
+    TOTP codes (RFC 6238, as django_otp.oath.totp) for several drift offsets.
+    
+    Educational Note: HMAC keying hashes two padded key blocks. The keyed
+    HMAC is built once and .copy()'d for each time step, so only the
+    counter itself is hashed per code.
+    """
+    base = hmac.new(device.bin_key, digestmod=hashlib.sha1)
+    counter = (now - device.t0) // device.step
+    modulus = 10 ** device.digits
+    
+    codes = {}
+    for drift_offset in drift_offsets:
+        mac = base.copy()
+        mac.update((counter + drift_offset).to_bytes(8, 'big'))
+        digest = mac.digest()
+        # Dynamic truncation (RFC 4226, section 5.3)
+        offset = digest[-1] & 0x0F
+        codes[drift_offset] = (int.from_bytes(digest[offset:offset + 4], 'big') & 0x7FFFFFFF) % modulus
+    return codes
+
 
 print("=" * 60)
 print("2FA DIAGNOSTIC REPORT")
@@ -54,14 +79,16 @@ print(f"   - Current time window: {current_time // device.step}")
 
 # Generate codes using device's token method
 print(f"\n🔢 Valid TOTP Codes (with tolerance={device.tolerance}):")
+# Every code the report shows (tolerance window and the +/-2 retry below)
+codes = totp_codes(device, current_time, range(-max(device.tolerance, 2), max(device.tolerance, 2) + 1))
 for drift_offset in range(-device.tolerance, device.tolerance + 1):
-    code = totp(device.key, step=device.step, t0=device.t0, digits=device.digits, drift=drift_offset)
+    code = codes[drift_offset]
     marker = "👉 CURRENT" if drift_offset == 0 else f"   (drift {drift_offset:+d})"
     print(f"   {code:06d} {marker}")
 
 # Test verification
 print(f"\n🧪 Testing device.verify_token():")
-current_code = totp(device.key, step=device.step, t0=device.t0, digits=device.digits, drift=0)
+current_code = codes[0]
 print(f"   - Current code: {current_code:06d}")
 result = device.verify_token(str(current_code).zfill(6))
 print(f"   - Verification result: {result}")
@@ -76,7 +103,7 @@ if not result:
     # Try manual verification
     print("\n   Trying manual verification with different drifts...")
     for drift_offset in range(-2, 3):
-        code = totp(device.key, step=device.step, t0=device.t0, digits=device.digits, drift=drift_offset)
+        code = codes[drift_offset]
         manual_result = device.verify_token(str(code).zfill(6))
         print(f"   - Code {code:06d} (drift {drift_offset:+d}): {manual_result}")
 
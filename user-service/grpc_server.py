@@ -10,12 +10,13 @@ Why separate servers?
 - gRPC is better for service-to-service (faster, type-safe)
 """
 
+import hmac
 import os
 import sys
+import signal
 import logging
 import grpc
 from concurrent import futures
-import time
 
 # Add Django project to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,14 +27,103 @@ import django
 django.setup()
 
 from django.contrib.auth.models import User
+from django.db import close_old_connections, connection
 from grpc_generated import user_pb2, user_pb2_grpc
 
 logger = logging.getLogger(__name__)
 
+# Seconds in-flight RPCs get to finish when the server is stopped
+SHUTDOWN_GRACE = 10
+
+# Educational Note: Each in-flight RPC occupies one worker thread for its
+# whole duration, so the pool size is the server's concurrency limit.
+# ValidateUser spends nearly all of its time waiting on the database, not
+# the CPU, so a pool much larger than the core count keeps bursts of calls
+# from queueing behind each other. Each worker thread holds its own
+# database connection, so keep this below the database's connection limit.
+GRPC_MAX_WORKERS = int(os.getenv('GRPC_MAX_WORKERS', '64'))
+
+# Educational Note: OrderService keeps one long-lived channel to this
+# server and pings it every 30s, even when idle (see GRPC_CHANNEL_OPTIONS in
+# orders/grpc_clients.py). By default a server only accepts a ping without
+# data every 5 minutes and doesn't expect pings with no call in flight, so
+# it would answer those pings with GOAWAY (too_many_pings) and the client
+# would have to reconnect. These options accept the client's keepalive.
+GRPC_SERVER_OPTIONS = [
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.min_ping_interval_without_data_ms', 10000),
+]
+
+# Columns UserInfo is built from
+USER_INFO_FIELDS = ('id', 'username', 'email', 'is_active')
+
+
 # Educational Note: Shared secret for service-to-service authentication
 # In production, use mutual TLS or service mesh (Istio) instead
 SERVICE_SECRET = os.getenv('SERVICE_SECRET', 'shared-secret-key-change-in-production')
 
+# Educational Note: SERVICE_SECRETS (comma-separated) lists every secret
+# accepted right now, so the secret can be rotated without downtime: add
+# the new one, move the callers over, then drop the old one. The expected
+# 'authorization' values are encoded once, at import, so a check formats
+# nothing per call. Each one is compared with hmac.compare_digest(), which
+# takes the same time however many leading bytes of a guess are right, so
+# response timing doesn't reveal the secret piece by piece. Headers of the
+# wrong length are rejected before that comparison.
+_VALID_TOKEN_BYTES = frozenset(
+    f'Bearer {secret.strip()}'.encode()
+    for secret in os.getenv('SERVICE_SECRETS', SERVICE_SECRET).split(',')
+    if secret.strip()
+)
+
+
+def _is_authorized(context):
+    """
+    Check the caller's service credentials.
+    
+    Educational Note: The metadata is scanned once for the authorization
+    key instead of being copied into a dict on every call.
+    """
+    for key, value in context.invocation_metadata():
+        if key == 'authorization':
+            token = value.encode()
+            return any(
+                len(token) == len(expected) and hmac.compare_digest(token, expected)
+                for expected in _VALID_TOKEN_BYTES
+            )
+    return False
+
+
+class DatabaseConnectionInterceptor(grpc.ServerInterceptor):
+    """
+    Run Django's per-request connection cleanup around every RPC.
+    
+    Educational Note: Django closes connections that are past CONN_MAX_AGE
+    (or broken) when an HTTP request starts and finishes. gRPC calls don't
+    go through that request cycle, so without this each worker thread would
+    keep its connection forever, even after the database dropped it.
+    """
+    
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or handler.unary_unary is None:
+            return handler
+        
+        behavior = handler.unary_unary
+        
+        def unary_unary(request, context):
+            close_old_connections()
+            try:
+                return behavior(request, context)
+            finally:
+                close_old_connections()
+        
+        return grpc.unary_unary_rpc_method_handler(
+            unary_unary,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
 
 class UserServiceServicer(user_pb2_grpc.UserServiceServicer):
     """
@@ -68,11 +158,8 @@ class UserServiceServicer(user_pb2_grpc.UserServiceServicer):
         
         # Educational Note: Extract metadata for authentication
         # In production, use mutual TLS or service mesh
-        metadata = dict(context.invocation_metadata())
-        auth_token = metadata.get('authorization', '')
-        
         # Verify service authentication
-        if auth_token != f'Bearer {SERVICE_SECRET}':
+        if not _is_authorized(context):
             logger.warning(f"Unauthorized gRPC call from {request.requesting_service}")
             context.set_code(grpc.StatusCode.UNAUTHENTICATED)
             context.set_details('Invalid service credentials')
@@ -88,7 +175,11 @@ class UserServiceServicer(user_pb2_grpc.UserServiceServicer):
         
         try:
             # Query user from database
-            user = User.objects.get(id=user_id, is_active=True)
+            # Educational Note: .only() loads just the columns UserInfo
+            # needs, not the password hash, names, dates and flags of the
+            # full auth_user row. The row is read on every call, so a user
+            # deactivated through the REST API is rejected right away.
+            user = User.objects.only(*USER_INFO_FIELDS).get(id=user_id, is_active=True)
             
             # Educational Note: We only return necessary fields
             # This minimizes data transfer and protects sensitive information
@@ -125,6 +216,25 @@ class UserServiceServicer(user_pb2_grpc.UserServiceServicer):
             )
 
 
+def _warm_up():
+    """
+    Do the one-time setup work before the first real RPC arrives.
+    
+    Educational Note: The first ORM query compiles SQL and loads database
+    backend code lazily, and the first message initializes its protobuf
+    class. Doing it here keeps that cost off the first caller's latency.
+    """
+    try:
+        User.objects.only('id').first()
+    except Exception as e:
+        logger.warning(f"⚠️  Warm-up query failed: {e}")
+    finally:
+        # Worker threads open their own connections
+        connection.close()
+    
+    user_pb2.ValidateUserResponse().SerializeToString()
+
+
 def serve():
     """
     Start the gRPC server.
@@ -139,8 +249,15 @@ def serve():
     port = os.getenv('GRPC_PORT', '50051')
     
     # Educational Note: ThreadPoolExecutor handles concurrent requests
-    # max_workers=10 means up to 10 concurrent gRPC calls
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    # max_workers=GRPC_MAX_WORKERS means up to that many concurrent gRPC calls
+    server = grpc.server(
+        futures.ThreadPoolExecutor(
+            max_workers=GRPC_MAX_WORKERS,
+            thread_name_prefix='grpc-user',
+        ),
+        interceptors=[DatabaseConnectionInterceptor()],
+        options=GRPC_SERVER_OPTIONS,
+    )
     
     # Register our service implementation
     user_pb2_grpc.add_UserServiceServicer_to_server(
@@ -152,10 +269,12 @@ def serve():
     
     # Start server
     server.start()
+    _warm_up()
     
     logger.info(f"✓ gRPC server started on port {port}")
     logger.info(f"  Service: UserService")
     logger.info(f"  Methods: ValidateUser")
+    logger.info(f"  Workers: {GRPC_MAX_WORKERS}")
     logger.info(f"  Protocol: gRPC (HTTP/2 + Protocol Buffers)")
     logger.info(f"")
     logger.info(f"Educational Note:")
@@ -164,13 +283,17 @@ def serve():
     logger.info(f"  - Type-safe (Protocol Buffers)")
     logger.info(f"  - Used by OrderService to validate users")
     
+    # Educational Note: Docker and Kubernetes stop containers with SIGTERM.
+    # Stopping the server makes wait_for_termination() return, so the
+    # process exits right away instead of waiting to be killed.
+    signal.signal(signal.SIGTERM, lambda *_: server.stop(grace=SHUTDOWN_GRACE))
+    
     try:
-        # Keep server running
-        while True:
-            time.sleep(86400)  # Sleep for a day
+        # Keep server running until it is stopped
+        server.wait_for_termination()
     except KeyboardInterrupt:
         logger.info("Shutting down gRPC server...")
-        server.stop(0)
+        server.stop(grace=SHUTDOWN_GRACE).wait()
 
 
 if __name__ == '__main__':
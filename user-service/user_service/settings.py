@@ -8,6 +8,7 @@ Other services verify tokens using the public key.
 
 import os
 from pathlib import Path
+from urllib.parse import unquote, urlparse
 from datetime import timedelta
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.primitives import serialization
@@ -48,6 +49,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'user_service.middleware.MinimumSizeGZipMiddleware',  # Compress responses >= 1 KB
     'corsheaders.middleware.CorsMiddleware',  # CORS must be before CommonMiddleware
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -80,12 +82,38 @@ WSGI_APPLICATION = 'user_service.wsgi.application'
 
 # Database
 # Educational Note: Each service has its own database (service isolation)
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'data' / 'db.sqlite3',
+# SQLite is used in development. When DATABASE_URL points at PostgreSQL (as
+# in docker-compose.prod.yml), use it instead: Postgres doesn't serialize
+# writers the way SQLite does, so logins and registrations don't hold up
+# ValidateUser calls. Django 4.2 has no built-in connection pool, so
+# CONN_MAX_AGE keeps each worker's connection open across requests instead
+# of connecting (TCP + auth) for every one.
+DATABASE_URL = os.getenv('DATABASE_URL', '')
+
+if DATABASE_URL.startswith(('postgres://', 'postgresql://')):
+    _database_url = urlparse(DATABASE_URL)
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': _database_url.path.lstrip('/'),
+            'USER': unquote(_database_url.username or ''),
+            'PASSWORD': unquote(_database_url.password or ''),
+            'HOST': _database_url.hostname or '',
+            'PORT': str(_database_url.port or ''),
+            'CONN_MAX_AGE': 60,  # Reuse connections for up to 60 seconds
+            'CONN_HEALTH_CHECKS': True,  # Drop dead connections before reuse
+        }
+    }
+else:
+    # WAL mode and the other PRAGMAs are applied per connection in
+    # users/apps.py (Django 4.2's SQLite backend has no init_command)
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'data' / 'db.sqlite3',
+            'CONN_MAX_AGE': 60,
+        }
     }
-}
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -252,6 +280,16 @@ def get_or_create_rsa_keys():
 # Generate or load RSA keys
 JWT_PRIVATE_KEY, JWT_PUBLIC_KEY_PEM = get_or_create_rsa_keys()
 
+# Educational Note: PyJWT accepts either PEM bytes or a key object. Given
+# PEM it parses the key again on every token it verifies; given the object
+# it uses it as-is. So the public key is parsed once here (the private key
+# above is already an object), and the PEM is kept for the public-key
+# endpoint.
+JWT_PUBLIC_KEY = serialization.load_pem_public_key(
+    JWT_PUBLIC_KEY_PEM,
+    backend=default_backend()
+)
+
 # ============================================================================
 # Django REST Framework Configuration
 # ============================================================================
@@ -285,7 +323,7 @@ SIMPLE_JWT = {
     # - VERIFYING_KEY: Public key for verifying tokens (all services)
     'ALGORITHM': 'RS256',
     'SIGNING_KEY': JWT_PRIVATE_KEY,  # Private key for signing
-    'VERIFYING_KEY': JWT_PUBLIC_KEY_PEM,  # Public key for verification
+    'VERIFYING_KEY': JWT_PUBLIC_KEY,  # Public key for verification (parsed once)
     
     'AUTH_HEADER_TYPES': ('Bearer',),
     'AUTH_HEADER_NAME': 'HTTP_AUTHORIZATION',
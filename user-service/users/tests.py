@@ -1,10 +1,70 @@
 """
 Tests for UserService.
 
-Educational Note: We'll add comprehensive tests later.
-This is a placeholder for the testing framework.
+Educational Note: The gRPC servicer is called directly with a mock context,
+so no server is started.
 """
 
+from unittest import mock
+
+import grpc
+from django.contrib.auth.models import User
 from django.test import TestCase
 
-# Tests will be added in later tasks
+import grpc_server
+from grpc_generated import user_pb2
+
+# Two accepted secrets, as during a rotation
+TOKENS = frozenset({b'Bearer current-secret', b'Bearer previous-secret'})
+
+
+def _context(authorization=None):
+    """A mock gRPC context carrying an authorization header (if given)."""
+    context = mock.Mock()
+    metadata = [('user-agent', 'tests')]
+    if authorization is not None:
+        metadata.append(('authorization', authorization))
+    context.invocation_metadata.return_value = metadata
+    return context
+
+
+@mock.patch.object(grpc_server, '_VALID_TOKEN_BYTES', TOKENS)
+class ValidateUserAuthTests(TestCase):
+    """ValidateUser only answers callers presenting an accepted service secret."""
+
+    def setUp(self):
+        self.servicer = grpc_server.UserServiceServicer()
+        self.user = User.objects.create_user('alice', 'alice@example.com', 'pw')
+
+    def validate(self, context):
+        request = user_pb2.ValidateUserRequest(user_id=self.user.id, requesting_service='tests')
+        return self.servicer.ValidateUser(request, context)
+
+    def test_current_and_previous_secret_are_accepted(self):
+        for token in ('Bearer current-secret', 'Bearer previous-secret'):
+            response = self.validate(_context(token))
+
+            self.assertTrue(response.valid)
+            self.assertEqual(response.user_info.username, 'alice')
+
+    def test_wrong_token_of_same_length_is_rejected(self):
+        context = _context('Bearer current-secreT')
+
+        response = self.validate(context)
+
+        self.assertFalse(response.valid)
+        context.set_code.assert_called_once_with(grpc.StatusCode.UNAUTHENTICATED)
+
+    def test_wrong_length_and_missing_header_are_rejected(self):
+        for context in (_context('Bearer current'), _context('current-secret'), _context()):
+            self.assertFalse(self.validate(context).valid)
+            context.set_code.assert_called_once_with(grpc.StatusCode.UNAUTHENTICATED)
+
+    def test_deactivation_is_seen_immediately(self):
+        self.assertTrue(self.validate(_context('Bearer current-secret')).valid)
+        # A queryset update sends no signals, as when another process changes the row
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        response = self.validate(_context('Bearer current-secret'))
+
+        self.assertFalse(response.valid)